@@ -4,6 +4,12 @@ Benchmark attrs using CodSpeed.
 
 from __future__ import annotations
 
+import abc
+import array
+import importlib
+import sys
+import types
+
 import pytest
 
 import attrs
@@ -42,6 +48,87 @@ def test_create_frozen_class():
         LocalC(1, "2", {})
 
 
+def test_create_abc_class():
+    """
+    Benchmark creating a slotted subclass of `abc.ABC`, whose metaclass makes
+    creating the slotted class more expensive.
+    """
+    for _ in range(ROUNDS):
+
+        @attrs.define
+        class LocalC(abc.ABC):
+            x: int
+            y: str
+            z: dict[str, int]
+
+            def method(self):
+                return super().method()
+
+
+def test_create_simple_class_bytecode_cache(tmp_path):
+    """
+    Benchmark creating a simple class with a warm bytecode cache.
+
+    Compare with `test_create_simple_class` that has to compile every method.
+    """
+    attrs.set_bytecode_cache(tmp_path)
+
+    try:
+        for _ in range(ROUNDS):
+
+            @attrs.define
+            class LocalC:
+                x: int
+                y: str
+                z: dict[str, int]
+
+    finally:
+        attrs.set_bytecode_cache(None)
+
+
+def test_create_simple_class_lazy_methods():
+    """
+    Benchmark creating a simple class whose repr and equality methods are
+    generated lazily and never used.
+    """
+    attrs.set_lazy_methods(True)
+
+    try:
+        for _ in range(ROUNDS):
+
+            @attrs.define
+            class LocalC:
+                x: int
+                y: str
+                z: dict[str, int]
+
+    finally:
+        attrs.set_lazy_methods(False)
+
+
+def test_create_mixed_style_classes():
+    """
+    Benchmark letting define() detect auto_attribs for a mix of annotated
+    and classic classes.
+    """
+    for _ in range(ROUNDS // 2):
+
+        @attrs.define
+        class Annotated:
+            x: int
+            y: str = attrs.field(default="y")
+
+        @attrs.define
+        class Classic:
+            x = attrs.field()
+            y = attrs.field(default="y")
+
+        @attrs.define
+        class Partially:
+            x: int
+            y = attrs.field(default="y")
+
+
 def test_create_simple_class_make_class():
     """
     Benchmark creating a simple class using attrs.make_class().
@@ -59,6 +146,113 @@ def test_create_simple_class_make_class():
         LocalC(1, "2", {})
 
 
+def test_create_simple_class_make_class_cached():
+    """
+    Benchmark requesting the same class from attrs.make_class() repeatedly
+    with cache=True.
+    """
+    for _ in range(ROUNDS):
+        LocalC = attrs.make_class(
+            "LocalC",
+            {
+                "x": attrs.field(type=int),
+                "y": attrs.field(type=str),
+                "z": attrs.field(type=dict[str, int]),
+            },
+            cache=True,
+        )
+
+        LocalC(1, "2", {})
+
+
+def test_create_classes_in_large_module():
+    """
+    Benchmark creating 500 classes in the same module.
+
+    The globals of each generated ``__init__`` must not grow -- neither in
+    time nor in memory -- with the number of classes in the module.
+    """
+    module = types.ModuleType("bench_large_module")
+    sys.modules[module.__name__] = module
+
+    try:
+        for i in range(500):
+            body = {
+                "__module__": module.__name__,
+                "__annotations__": {"x": "int", "y": "str"},
+            }
+            cls = types.new_class(
+                f"C{i}", (), {}, lambda ns, body=body: ns.update(body)
+            )
+
+            setattr(module, cls.__name__, attrs.define(cls))
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_create_deep_hierarchy():
+    """
+    Benchmark creating subclasses at the bottom of a hierarchy that is eight
+    levels deep with five fields per level.
+    """
+    base = object
+    for level in range(8):
+        base = attrs.make_class(
+            f"Level{level}",
+            {f"f{level}_{i}": attrs.field(default=i) for i in range(5)},
+            bases=(base,),
+        )
+
+    for _ in range(ROUNDS):
+
+        @attrs.define
+        class LocalC(base):
+            x: int = 0
+
+
+def test_resolve_module_types():
+    """
+    Benchmark resolving the string annotations of a module with a hierarchy
+    of 50 classes.
+    """
+    source = "import typing, attrs\n" + "".join(
+        f"@attrs.define\nclass C{i}({f'C{i - 1}' if i else ''}):\n"
+        f"    a{i}: 'typing.Optional[int]' = None\n"
+        f"    b{i}: 'typing.Dict[str, C0]' = attrs.Factory(dict)\n"
+        for i in range(50)
+    )
+    module = types.ModuleType("bench_resolve_module")
+    sys.modules[module.__name__] = module
+
+    try:
+        exec(source, module.__dict__)
+        attrs.resolve_module_types(module)
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_import_attrs():
+    """
+    Benchmark importing attrs from scratch.
+
+    Submodules that most programs don't need at startup are only imported on
+    first access.
+    """
+    saved = {
+        name: module
+        for name, module in sys.modules.items()
+        if name.partition(".")[0] in ("attr", "attrs")
+    }
+    try:
+        for _ in range(10):
+            for name in saved:
+                sys.modules.pop(name, None)
+
+            importlib.import_module("attrs")
+    finally:
+        sys.modules.update(saved)
+
+
 @attrs.define
 class C:
     x: int = 0
@@ -82,6 +276,159 @@ def test_instantiate_with_defaults():
         C()
 
 
+@attrs.define
+class Validated:
+    x: int = attrs.field(validator=attrs.validators.instance_of(int))
+    y: str | None = attrs.field(
+        validator=attrs.validators.optional(attrs.validators.instance_of(str))
+    )
+    z: str = attrs.field(validator=attrs.validators.in_(("a", "b", "c")))
+
+
+def test_instantiate_validated():
+    """
+    Benchmark instantiating a class with simple validators.
+    """
+    for _ in range(ROUNDS):
+        Validated(1, None, "b")
+
+
+@attrs.define
+class Ranged:
+    x: int = attrs.field(
+        validator=[
+            attrs.validators.instance_of(int),
+            attrs.validators.ge(0),
+            attrs.validators.lt(100),
+        ]
+    )
+    y: float = attrs.field(validator=attrs.validators.in_range(0.0, 1.0))
+
+
+def test_instantiate_ranged():
+    """
+    Benchmark instantiating a class with range checks.
+    """
+    for _ in range(ROUNDS):
+        Ranged(42, 0.5)
+
+
+def test_setattr_ranged():
+    """
+    Benchmark setting attributes with range checks.
+    """
+    r = Ranged(42, 0.5)
+
+    for _ in range(ROUNDS):
+        r.x = 23
+        r.y = 0.25
+
+
+def test_instantiate_validated_sampled():
+    """
+    Benchmark instantiating a class with simple validators if only one in a
+    hundred instances is validated.
+    """
+    attrs.validators.set_sampling(0.01)
+    try:
+        for _ in range(ROUNDS):
+            Validated(1, None, "b")
+    finally:
+        attrs.validators.set_sampling()
+
+
+def test_instantiate_validated_disabled_in_context():
+    """
+    Benchmark instantiating a class with simple validators that are disabled
+    in the current context.
+    """
+    with attrs.validators.disabled_in_context():
+        for _ in range(ROUNDS):
+            Validated(1, None, "b")
+
+
+INTS = list(range(10_000))
+
+
+@attrs.define
+class DeepValidated:
+    x: list[int] = attrs.field(
+        validator=attrs.validators.deep_iterable(
+            attrs.validators.instance_of(int),
+            attrs.validators.instance_of(list),
+        )
+    )
+
+
+def test_instantiate_deep_validated():
+    """
+    Benchmark instantiating a class that validates a list of 10,000 ints.
+    """
+    for _ in range(ROUNDS // 100):
+        DeepValidated(INTS)
+
+
+def test_validate_deep_iterable():
+    """
+    Benchmark calling a composed validator on a list of 10,000 ints.
+    """
+    v = attrs.validators.deep_iterable(
+        attrs.validators.and_(
+            attrs.validators.instance_of(int), attrs.validators.ge(0)
+        )
+    )
+    a = attrs.fields(DeepValidated).x
+
+    for _ in range(ROUNDS // 100):
+        v(None, a, INTS)
+
+
+def test_validate_deep_iterable_array():
+    """
+    Benchmark calling a composed validator on an array.array of 10,000 ints.
+    """
+    v = attrs.validators.deep_iterable(attrs.validators.instance_of(int))
+    a = attrs.fields(DeepValidated).x
+    ints = array.array("q", INTS)
+
+    for _ in range(ROUNDS // 100):
+        v(None, a, ints)
+
+
+@pytest.mark.parametrize("count", [10, 1_000, 100_000])
+def test_validate_in(count):
+    """
+    Benchmark calling in_ with *count* options on the last one.
+    """
+    codes = [f"code-{i}" for i in range(count)]
+    v = attrs.validators.in_(codes)
+    a = attrs.fields(Validated).z
+    code = codes[-1]
+
+    for _ in range(ROUNDS):
+        v(None, a, code)
+
+
+def test_validate():
+    """
+    Benchmark re-validating an instance of a class with simple validators.
+    """
+    v = Validated(1, None, "b")
+
+    for _ in range(ROUNDS):
+        attrs.validate(v)
+
+
+def test_validate_many():
+    """
+    Benchmark validating 10,000 instances of a class with simple validators.
+    """
+    instances = [Validated(i, None, "b") for i in range(10_000)]
+
+    for _ in range(ROUNDS // 1_000):
+        attrs.validate_many(Validated, instances)
+
+
 def test_eq_equal():
     """
     Benchmark comparing two equal instances for equality.
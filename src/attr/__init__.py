@@ -4,13 +4,37 @@
 Classes Without Boilerplate
 """
 
+from __future__ import annotations
+
+import sys
+
+from collections.abc import Callable
 from functools import partial
-from typing import Callable, Protocol
 
-from . import converters, exceptions, filters, setters, validators
-from ._cmp import cmp_using
-from ._config import get_run_validators, set_run_validators
-from ._funcs import asdict, assoc, astuple, evolve, has, resolve_types
+from . import exceptions, setters
+from ._config import (
+    get_bytecode_cache,
+    get_lazy_methods,
+    get_linecache_policy,
+    get_precompiled_methods,
+    get_run_validators,
+    get_strip_validators,
+    set_bytecode_cache,
+    set_lazy_methods,
+    set_linecache_policy,
+    set_precompiled_methods,
+    set_run_validators,
+    set_strip_validators,
+)
+from ._funcs import (
+    asdict,
+    assoc,
+    astuple,
+    evolve,
+    has,
+    resolve_module_types,
+    resolve_types,
+)
 from ._make import (
     NOTHING,
     Attribute,
@@ -20,11 +44,14 @@ from ._make import (
     attrs,
     fields,
     fields_dict,
+    get_linecache_footprint,
+    get_template_cache_info,
     make_class,
     validate,
+    validate_many,
 )
 from ._next_gen import define, field, frozen, mutable
-from ._version_info import VersionInfo
+from ._profile import profile_class_creation
 
 
 s = attributes = attrs
@@ -32,10 +59,6 @@ ib = attr = attrib
 dataclass = partial(attrs, auto_attribs=True)  # happy Easter ;)
 
 
-class AttrsInstance(Protocol):
-    pass
-
-
 __all__ = [
     "Attribute",
     "AttrsInstance",
@@ -59,27 +82,69 @@ __all__ = [
     "fields_dict",
     "filters",
     "frozen",
+    "get_bytecode_cache",
+    "get_lazy_methods",
+    "get_linecache_footprint",
+    "get_linecache_policy",
+    "get_precompiled_methods",
     "get_run_validators",
+    "get_strip_validators",
+    "get_template_cache_info",
     "has",
     "ib",
     "make_class",
     "mutable",
+    "profile_class_creation",
+    "resolve_module_types",
     "resolve_types",
     "s",
+    "set_bytecode_cache",
+    "set_lazy_methods",
+    "set_linecache_policy",
+    "set_precompiled_methods",
     "set_run_validators",
+    "set_strip_validators",
     "setters",
     "validate",
+    "validate_many",
     "validators",
 ]
 
 
-def _make_getattr(mod_name: str) -> Callable:
+# Names that are only imported on first access to keep importing attrs cheap
+# for programs that don't need them. Maps the name to its module and the
+# attribute within it, or None for submodules.
+_LAZY = {
+    "AttrsInstance": ("attr._typing", "AttrsInstance"),
+    "VersionInfo": ("attr._version_info", "VersionInfo"),
+    "cmp_using": ("attr._cmp", "cmp_using"),
+    "converters": ("attr.converters", None),
+    "filters": ("attr.filters", None),
+    "validators": ("attr.validators", None),
+}
+
+
+def _make_getattr(mod_name: str, lazy: dict | None = None) -> Callable:
     """
     Create a metadata proxy for packaging information that uses *mod_name* in
     its warnings and errors.
+
+    Names in *lazy* are imported on first access and cached in the module.
     """
 
     def __getattr__(name: str) -> str:
+        if lazy is not None and name in lazy:
+            import importlib
+
+            module_name, attribute = lazy[name]
+            value = importlib.import_module(module_name)
+            if attribute is not None:
+                value = getattr(value, attribute)
+
+            setattr(sys.modules[mod_name], name, value)
+
+            return value
+
         if name not in ("__version__", "__version_info__"):
             msg = f"module {mod_name} has no attribute {name}"
             raise AttributeError(msg)
@@ -89,6 +154,8 @@ def _make_getattr(mod_name: str) -> Callable:
         meta = metadata("attrs")
 
         if name == "__version_info__":
+            from ._version_info import VersionInfo
+
             return VersionInfo._from_version_string(meta["version"])
 
         return meta["version"]
@@ -96,4 +163,4 @@ def _make_getattr(mod_name: str) -> Callable:
     return __getattr__
 
 
-__getattr__ = _make_getattr(__name__)
+__getattr__ = _make_getattr(__name__, _LAZY)
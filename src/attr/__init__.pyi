@@ -1,10 +1,15 @@
+import contextlib
 import enum
+import functools
+import os
 import sys
 
+from types import ModuleType
 from typing import (
     Any,
     Callable,
     Generic,
+    Iterable,
     Mapping,
     Protocol,
     Sequence,
@@ -301,6 +306,9 @@ def attrs(
 def fields(cls: type[AttrsInstance]) -> Any: ...
 def fields_dict(cls: type[AttrsInstance]) -> dict[str, Attribute[Any]]: ...
 def validate(inst: AttrsInstance) -> None: ...
+def validate_many(
+    cls: type[AttrsInstance], instances: Iterable[AttrsInstance]
+) -> list[tuple[int, Attribute[Any], Exception]]: ...
 def resolve_types(
     cls: _A,
     globalns: dict[str, Any] | None = ...,
@@ -308,6 +316,12 @@ def resolve_types(
     attribs: list[Attribute[Any]] | None = ...,
     include_extras: bool = ...,
 ) -> _A: ...
+def resolve_module_types(
+    module: ModuleType,
+    globalns: dict[str, Any] | None = ...,
+    localns: dict[str, Any] | None = ...,
+    include_extras: bool = ...,
+) -> list[type]: ...
 
 # TODO: add support for returning a proper attrs class from the mypy plugin
 # we use Any instead of _CountingAttr so that e.g. `make_class('Foo',
@@ -335,6 +349,7 @@ def make_class(
     collect_by_mro: bool = ...,
     on_setattr: _OnSetAttrArgType | None = ...,
     field_transformer: _FieldTransformer | None = ...,
+    cache: bool = ...,
 ) -> type: ...
 
 # _funcs --
@@ -371,6 +386,25 @@ def evolve(inst: _T, **changes: Any) -> _T: ...
 
 def set_run_validators(run: bool) -> None: ...
 def get_run_validators() -> bool: ...
+def set_bytecode_cache(directory: str | os.PathLike[str] | None) -> None: ...
+def get_bytecode_cache() -> str | None: ...
+def set_lazy_methods(lazy: bool) -> None: ...
+def get_lazy_methods() -> bool: ...
+def set_linecache_policy(
+    policy: Literal["eager", "lazy", "off"], max_entries: int | None = ...
+) -> None: ...
+def get_linecache_policy() -> (
+    tuple[Literal["eager", "lazy", "off"], int | None]
+): ...
+def get_linecache_footprint() -> tuple[int, int]: ...
+def get_template_cache_info() -> functools._CacheInfo: ...
+def set_precompiled_methods(enabled: bool) -> None: ...
+def get_precompiled_methods() -> bool: ...
+def set_strip_validators(strip: bool) -> None: ...
+def get_strip_validators() -> bool: ...
+def profile_class_creation() -> (
+    contextlib.AbstractContextManager[list[tuple[str | None, str, float]]]
+): ...
 
 # aliases --
 
@@ -2,16 +2,13 @@
 
 
 #testing
-import inspect
-import platform
 import sys
 import threading
 
 from collections.abc import Mapping, Sequence  # noqa: F401
-from typing import _GenericAlias
 
 
-PYPY = platform.python_implementation() == "PyPy"
+PYPY = sys.implementation.name == "pypy"
 PY_3_9_PLUS = sys.version_info[:2] >= (3, 9)
 PY_3_10_PLUS = sys.version_info[:2] >= (3, 10)
 PY_3_11_PLUS = sys.version_info[:2] >= (3, 11)
@@ -43,6 +40,8 @@ class _AnnotationExtractor:
     __slots__ = ["sig"]
 
     def __init__(self, callable):
+        import inspect
+
         try:
             self.sig = inspect.signature(callable)
         except (ValueError, TypeError):  # inspect failed
@@ -56,7 +55,7 @@ class _AnnotationExtractor:
             return None
 
         params = list(self.sig.parameters.values())
-        if params and params[0].annotation is not inspect.Parameter.empty:
+        if params and params[0].annotation is not params[0].empty:
             return params[0].annotation
 
         return None
@@ -65,10 +64,7 @@ class _AnnotationExtractor:
         """
         Return the return type if it's not empty.
         """
-        if (
-            self.sig
-            and self.sig.return_annotation is not inspect.Signature.empty
-        ):
+        if self.sig and self.sig.return_annotation is not self.sig.empty:
             return self.sig.return_annotation
 
         return None
@@ -91,6 +87,8 @@ repr_context = threading.local()
 
 def get_generic_base(cl):
     """If this is a generic class (A[str]), return the generic base for it."""
-    if cl.__class__ is _GenericAlias:
+    # There can't be any generic aliases before typing has been imported.
+    typing = sys.modules.get("typing")
+    if typing is not None and cl.__class__ is typing._GenericAlias:
         return cl.__origin__
     return None
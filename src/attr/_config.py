@@ -1,8 +1,37 @@
 # SPDX-License-Identifier: MIT
 
-__all__ = ["set_run_validators", "get_run_validators"]
+import os
+
+from contextvars import ContextVar
+
+
+__all__ = [
+    "set_run_validators",
+    "get_run_validators",
+    "set_bytecode_cache",
+    "get_bytecode_cache",
+    "set_lazy_methods",
+    "get_lazy_methods",
+    "set_linecache_policy",
+    "get_linecache_policy",
+    "set_precompiled_methods",
+    "get_precompiled_methods",
+    "set_strip_validators",
+    "get_strip_validators",
+]
 
 _run_validators = True
+# Whether validators are disabled in the current context.
+_disabled_in_context = ContextVar("attrs_disabled_in_context", default=False)
+# Callable that decides whether to validate an instance if validators are
+# sampled or disabled in some context, None if all instances are validated.
+_validation_check = None
+_bytecode_cache_dir = None
+_lazy_methods = False
+_linecache_policy = "eager"
+_linecache_max_entries = None
+_precompiled_methods = False
+_strip_validators = bool(os.environ.get("ATTRS_STRIP_VALIDATORS"))
 
 
 def set_run_validators(run):
@@ -29,3 +58,221 @@ def get_run_validators():
         instead.
     """
     return _run_validators
+
+
+def set_bytecode_cache(directory):
+    """
+    Cache the bytecode of the methods that *attrs* generates in *directory*.
+
+    By default, *attrs* calls `compile` for every method that it writes.  With
+    a cache directory set, the bytecode is stored there and processes that
+    create the same classes later load it instead of compiling the source
+    again -- much like Python's own ``__pycache__``.
+
+    Entries are keyed by the generated source code and the bytecode version of
+    the running interpreter, so it's safe to share a directory between
+    different versions of Python and *attrs*.
+
+    Since the cache is only consulted when a class is created, call this
+    before importing the modules whose classes should be cached.
+
+    Args:
+        directory (str | os.PathLike | None):
+            The directory to store the bytecode in.  It is created if it
+            doesn't exist yet.  Pass `None` to disable caching again.
+
+    .. versionadded:: 24.3.0
+    """
+    global _bytecode_cache_dir
+
+    if directory is None:
+        _bytecode_cache_dir = None
+        return
+
+    if not isinstance(directory, (str, os.PathLike)):
+        msg = "'directory' must be a str, an os.PathLike, or None."
+        raise TypeError(msg)
+
+    from pathlib import Path
+
+    path = Path(directory).resolve()
+    path.mkdir(parents=True, exist_ok=True)
+
+    _bytecode_cache_dir = str(path)
+
+
+def get_bytecode_cache():
+    """
+    Return the directory that is used to cache the bytecode of generated
+    methods, or `None` if caching is disabled.
+
+    .. versionadded:: 24.3.0
+    """
+    return _bytecode_cache_dir
+
+
+def set_lazy_methods(lazy):
+    """
+    Set whether *attrs* generates rarely used methods lazily.
+
+    If *lazy* is True, the ``__repr__``, equality, and ordering methods of
+    classes that are created afterwards are only generated when they're
+    accessed for the first time.  Until then, the class holds a small
+    placeholder in their stead.  This makes creating classes faster and
+    saves memory for classes whose methods are never used.
+
+    By default, all methods are generated when the class is created.
+
+    Args:
+        lazy (bool): Whether to generate the methods lazily.
+
+    .. versionadded:: 24.3.0
+    """
+    if not isinstance(lazy, bool):
+        msg = "'lazy' must be bool."
+        raise TypeError(msg)
+    global _lazy_methods
+    _lazy_methods = lazy
+
+
+def get_lazy_methods():
+    """
+    Return whether *attrs* generates rarely used methods lazily.
+
+    .. versionadded:: 24.3.0
+    """
+    return _lazy_methods
+
+
+def set_linecache_policy(policy, max_entries=None):
+    """
+    Set how *attrs* registers the source code of generated methods in
+    `linecache`.
+
+    The source code is registered so that tracebacks, debuggers like
+    :mod:`pdb`, and `inspect.getsource` can show it.  If you create a lot of
+    classes dynamically, these entries add up since they are never evicted by
+    default.
+
+    Args:
+        policy (str):
+            One of:
+
+            - ``"eager"`` (default): Register the lines of the source code.
+            - ``"lazy"``: Register the source code as a single string that is
+              only split into lines once something asks for them.  This uses
+              less memory and time as long as nobody looks.
+            - ``"off"``: Don't register the source code at all.  Tracebacks
+              won't show the source of generated methods and
+              `inspect.getsource` fails for them.
+
+        max_entries (int | None):
+            If not `None`, *attrs* keeps at most this many of the entries
+            that it registers from now on in `linecache` and evicts the least
+            recently registered ones.  The source of evicted methods isn't
+            available anymore.
+
+    .. versionadded:: 24.3.0
+    """
+    if policy not in ("eager", "lazy", "off"):
+        msg = "'policy' must be one of 'eager', 'lazy', or 'off'."
+        raise ValueError(msg)
+
+    if max_entries is not None and (
+        not isinstance(max_entries, int)
+        or isinstance(max_entries, bool)
+        or max_entries < 1
+    ):
+        msg = "'max_entries' must be a positive int or None."
+        raise ValueError(msg)
+
+    global _linecache_policy, _linecache_max_entries
+    _linecache_policy = policy
+    _linecache_max_entries = max_entries
+
+
+def get_linecache_policy():
+    """
+    Return the current `linecache` policy and the maximum number of entries as
+    a tuple.
+
+    .. versionadded:: 24.3.0
+    """
+    return _linecache_policy, _linecache_max_entries
+
+
+def set_precompiled_methods(enabled):
+    """
+    Set whether *attrs* uses precompiled methods from companion modules.
+
+    ``python -m attrs generate mypackage.models`` writes the source code of
+    the methods that *attrs* generates for the classes in
+    ``mypackage.models`` into the companion module
+    ``mypackage.models_attrs_generated`` next to it.
+
+    If *enabled* is True, *attrs* looks for the companion module of the
+    module of each class that is created afterwards.  Methods whose source
+    code is still the same are then created from the companion module's
+    bytecode that Python caches like for any other module, instead of being
+    compiled.  Methods that changed since the companion module has been
+    generated are compiled as usual.
+
+    Args:
+        enabled (bool): Whether to use companion modules.
+
+    .. versionadded:: 24.3.0
+    """
+    if not isinstance(enabled, bool):
+        msg = "'enabled' must be bool."
+        raise TypeError(msg)
+    global _precompiled_methods
+    _precompiled_methods = enabled
+
+
+def get_precompiled_methods():
+    """
+    Return whether *attrs* uses precompiled methods from companion modules.
+
+    .. versionadded:: 24.3.0
+    """
+    return _precompiled_methods
+
+
+def set_strip_validators(strip):
+    """
+    Set whether *attrs* leaves validators out of the classes it creates.
+
+    If *strip* is True, the ``__init__`` methods of classes that are created
+    afterwards don't contain any validation code at all, and
+    `attrs.setters.validate` hooks -- also within lists of hooks,
+    `attrs.setters.pipe`, and the default hooks of `attrs.define` -- are left
+    out of their ``__setattr__``.  Unlike
+    `attrs.validators.set_disabled`, this can't be undone for classes that
+    already exist, but it also removes the remaining cost of checking whether
+    validators are disabled.  Explicit calls to `attrs.validate` still run
+    the validators.
+
+    Use it for trusted hot paths that have been validated thoroughly
+    elsewhere, e.g. in tests.  It's enabled by default if the
+    ``ATTRS_STRIP_VALIDATORS`` environment variable is set to a non-empty
+    value.
+
+    Args:
+        strip (bool): Whether to leave validators out.
+
+    .. versionadded:: 24.3.0
+    """
+    if not isinstance(strip, bool):
+        msg = "'strip' must be bool."
+        raise TypeError(msg)
+    global _strip_validators
+    _strip_validators = strip
+
+
+def get_strip_validators():
+    """
+    Return whether *attrs* leaves validators out of the classes it creates.
+
+    .. versionadded:: 24.3.0
+    """
+    return _strip_validators
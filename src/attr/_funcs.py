@@ -2,9 +2,10 @@
 
 
 import copy
+import sys
 
-from ._compat import PY_3_9_PLUS, get_generic_base
-from ._make import _OBJ_SETATTR, NOTHING, fields
+from ._compat import PY_3_9_PLUS, _get_annotations, get_generic_base
+from ._make import _OBJ_SETATTR, NOTHING, _identifier_re, fields
 from .exceptions import AttrsAttributeNotFoundError
 
 
@@ -514,9 +515,146 @@ def resolve_types(
             if field.name in hints:
                 # Since fields have been frozen we must work around it.
                 _OBJ_SETATTR(field, "type", hints[field.name])
+        # Subclasses that are created from now on must inherit the resolved
+        # types instead of the cached copies from before.
+        if "__attrs_inherited_attrs__" in cls.__dict__:
+            del cls.__attrs_inherited_attrs__
         # We store the class we resolved so that subclasses know they haven't
         # been resolved.
         cls.__attrs_types_resolved__ = cls
 
     # Return the class so you can use it as a decorator too.
     return cls
+
+
+def resolve_module_types(
+    module, globalns=None, localns=None, include_extras=True
+):
+    """
+    Resolve the types of all *attrs* classes in *module* at once.
+
+    This is equivalent to calling `resolve_types` on each class that has been
+    defined on the top level of *module*, but much faster for modules with
+    many classes: the annotations of each class are only evaluated once and
+    reused for all of its subclasses, and identical annotation strings
+    within the module are only evaluated once.
+
+    Args:
+        module (types.ModuleType): Module whose classes to resolve.
+
+        globalns (dict | None): Dictionary containing global variables.
+
+        localns (dict | None): Dictionary containing local variables.
+
+        include_extras (bool): Same as for `resolve_types`.
+
+    Raises:
+        NameError: If types cannot be resolved because of missing variables.
+
+    Returns:
+        list[type]:
+            The *attrs* classes of *module*, base classes before their
+            subclasses.
+
+    .. versionadded:: 24.3.0
+    """
+    classes = {
+        id(cls): cls
+        for cls in vars(module).values()
+        if isinstance(cls, type)
+        and cls.__module__ == module.__name__
+        and has(cls)
+    }
+    # A base class always has a shorter MRO than its subclasses.
+    classes = sorted(classes.values(), key=lambda cls: len(cls.__mro__))
+
+    own_hints = {}
+    evaluated = {}
+    for cls in classes:
+        if getattr(cls, "__attrs_types_resolved__", None) == cls:
+            continue
+
+        hints = {}
+        for base in reversed(cls.__mro__):
+            base_hints = own_hints.get(base)
+            if base_hints is None:
+                base_hints = own_hints[base] = _resolve_own_types(
+                    base, globalns, localns, include_extras, evaluated
+                )
+            hints.update(base_hints)
+
+        for field in fields(cls):
+            if field.name in hints:
+                _OBJ_SETATTR(field, "type", hints[field.name])
+        if "__attrs_inherited_attrs__" in cls.__dict__:
+            del cls.__attrs_inherited_attrs__
+        cls.__attrs_types_resolved__ = cls
+
+    return classes
+
+
+def _resolve_own_types(cls, globalns, localns, include_extras, evaluated):
+    """
+    Return the type hints for the annotations that *cls* defines itself, the
+    way `typing.get_type_hints` would resolve them.
+
+    *evaluated* maps annotation strings and the namespaces they were evaluated
+    in to their results and is shared between all calls for a module.
+    """
+    annotations = _get_annotations(cls)
+    if not annotations:
+        return {}
+
+    import typing
+
+    module_dict = getattr(sys.modules.get(cls.__module__), "__dict__", {})
+    cls_dict = dict(vars(cls))
+    if globalns is None and localns is None:
+        # Like get_type_hints(), look up names in the module before the class
+        # body.
+        base_globals, base_locals = cls_dict, module_dict
+    else:
+        base_globals = module_dict if globalns is None else globalns
+        base_locals = cls_dict if localns is None else localns
+
+    # Strings that only use names that the class body doesn't shadow evaluate
+    # to the same type in every class of the module.
+    shadowed = cls_dict.keys() | {
+        p.__name__ for p in getattr(cls, "__type_params__", ())
+    }
+    namespaces = (cls.__module__, id(globalns), id(localns))
+    strings = {}
+    annotations = dict(annotations)
+    for name, annotation in annotations.items():
+        if not isinstance(annotation, str) or shadowed.intersection(
+            _identifier_re().findall(annotation)
+        ):
+            continue
+
+        key = (annotation, namespaces)
+        if key in evaluated:
+            annotations[name] = evaluated[key]
+        else:
+            strings[name] = key
+
+    # Let get_type_hints() evaluate the annotations of a stand-in class
+    # without bases to not evaluate inherited annotations again.
+    stand_in = type(
+        cls.__name__,
+        (),
+        {"__annotations__": annotations, "__module__": cls.__module__},
+    )
+    if getattr(cls, "__type_params__", ()):
+        stand_in.__type_params__ = cls.__type_params__
+
+    kwargs = {}
+    if PY_3_9_PLUS:
+        kwargs["include_extras"] = include_extras
+
+    hints = typing.get_type_hints(
+        stand_in, globalns=base_globals, localns=base_locals, **kwargs
+    )
+    for name, key in strings.items():
+        evaluated[key] = hints[name]
+
+    return hints
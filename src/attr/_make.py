@@ -3,22 +3,25 @@
 from __future__ import annotations
 
 import abc
+import builtins
 import contextlib
 import copy
 import enum
 import functools
-import inspect
 import itertools
 import linecache
+import marshal
+import os
 import sys
+import threading
 import types
-import typing
+import weakref
 
 from operator import itemgetter
 
 # We need to import _compat itself in addition to the _compat members to avoid
 # having the thread-local in the globals here.
-from . import _compat, _config, setters
+from . import _compat, _config, _profile, setters
 from ._compat import (
     PY_3_10_PLUS,
     PY_3_11_PLUS,
@@ -26,6 +29,7 @@ from ._compat import (
     _get_annotations,
     get_generic_base,
 )
+from ._profile import _profiled, _profiled_class
 from .exceptions import (
     DefaultAlreadySetError,
     FrozenInstanceError,
@@ -50,12 +54,44 @@ _HASH_CACHE_FIELD = "_attrs_cached_hash"
 
 _EMPTY_METADATA_SINGLETON = types.MappingProxyType({})
 
+
 # Unique object for unequivocal getattr() defaults.
 _SENTINEL = object()
 
 _DEFAULT_ON_SETATTR = setters.pipe(setters.convert, setters.validate)
 
 
+def _strip_validate_hook(on_setattr):
+    """
+    Return *on_setattr* without validating if validators are stripped.
+
+    `setters.pipe` hooks -- also the ones that lists of hooks turn into -- are
+    rebuilt without `setters.validate`.
+    """
+    if on_setattr is setters.validate:
+        return setters.NO_OP
+
+    piped = getattr(on_setattr, "_setters", None)
+    if piped is None:
+        return on_setattr
+
+    stripped = [
+        hook
+        for hook in map(_strip_validate_hook, piped)
+        if hook is not setters.NO_OP
+    ]
+    if len(stripped) == len(piped) and all(
+        hook is old for hook, old in zip(stripped, piped)
+    ):
+        return on_setattr
+    if not stripped:
+        return setters.NO_OP
+    if len(stripped) == 1:
+        return stripped[0]
+
+    return setters.pipe(*stripped)
+
+
 class _Nothing(enum.Enum):
     """
     Sentinel to indicate the lack of a value when `None` is ambiguous.
@@ -205,32 +241,339 @@ def attrib(
     )
 
 
+# Factories of precompiled functions by the fingerprints of their scripts.
+_precompiled = {}
+
+# Modules whose companion modules have been looked for.
+_precompiled_modules = set()
+
+# List of (name, filename, script) tuples while recording scripts.
+_recorded_scripts = None
+
+
 def _compile_and_eval(script, globs, locs=None, filename=""):
     """
     Evaluate the script with the given global (globs) and local (locs)
     variables.
     """
-    bytecode = compile(script, filename, "exec")
+    if _precompiled:
+        factory = _precompiled.get(_fingerprint(script))
+        if factory is not None:
+            # eval() would add them to globs too.
+            globs.setdefault("__builtins__", builtins)
+            func = types.FunctionType(factory.__code__, globs)()
+            (globs if locs is None else locs)[func.__name__] = func
+            return
+
+    # N.B. Concatenating the scripts of many classes into a single compile()
+    # call is *not* faster: compile() time is dominated by the size of the
+    # source, not by a fixed per-call overhead. And since every class needs
+    # its own globals, each script has to be wrapped into a factory function,
+    # which makes the combined script slower to compile than its parts. Use
+    # the bytecode cache to avoid compiling altogether.
+    bytecode = _compile(script, filename)
     eval(bytecode, globs, locs)
 
 
+@_profiled("compile")
+def _compile(script, filename):
+    """
+    Compile *script* as if it came from *filename*.
+
+    If a bytecode cache directory is set, try to load the bytecode from there
+    first and store it there after compiling.
+    """
+    cache_dir = _config._bytecode_cache_dir
+    if cache_dir is None:
+        return compile(script, filename, "exec")
+
+    from importlib.util import MAGIC_NUMBER
+    from pathlib import Path
+
+    path = (
+        Path(cache_dir)
+        / f"{_fingerprint(script)}.{sys.implementation.cache_tag}.pyc"
+    )
+
+    bytecode = _load_bytecode(path, MAGIC_NUMBER)
+    if bytecode is not None:
+        return _relocate_bytecode(bytecode, filename)
+
+    bytecode = compile(script, filename, "exec")
+    _store_bytecode(path, MAGIC_NUMBER, bytecode)
+
+    return bytecode
+
+
+def _fingerprint(script):
+    """
+    Return a fingerprint of *script* that changes if its source changes.
+    """
+    import hashlib
+
+    return hashlib.sha256(script.encode()).hexdigest()
+
+
+def _load_precompiled(module):
+    """
+    Look for the companion module of *module* once and register its
+    precompiled functions.
+    """
+    if module in _precompiled_modules:
+        return
+
+    _precompiled_modules.add(module)
+
+    import importlib
+    import importlib.util
+
+    name = f"{module}_attrs_generated"
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return
+
+    if spec is not None:
+        _precompiled.update(importlib.import_module(name).precompiled)
+
+
+@contextlib.contextmanager
+def _record_scripts():
+    """
+    Record the name, filename, and script of every method generated from a
+    script while active.
+    """
+    global _recorded_scripts
+
+    outer = _recorded_scripts
+    _recorded_scripts = records = []
+    try:
+        yield records
+    finally:
+        _recorded_scripts = outer
+
+
+def _load_bytecode(path, magic):
+    """
+    Load a code object from *path* unless it's missing, corrupt, or was
+    written by an interpreter with a different *magic* number.
+    """
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+
+    if data[: len(magic)] != magic:
+        return None
+
+    try:
+        bytecode = marshal.loads(data[len(magic) :])  # noqa: S302
+    except (EOFError, ValueError, TypeError):
+        return None
+
+    return bytecode if isinstance(bytecode, types.CodeType) else None
+
+
+def _store_bytecode(path, magic, bytecode):
+    """
+    Atomically write *bytecode* to *path*.
+
+    Failing to write the cache is never fatal.
+    """
+    tmp = path.with_name(
+        f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp"
+    )
+    try:
+        tmp.write_bytes(magic + marshal.dumps(bytecode))
+        tmp.replace(path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+
+
+def _relocate_bytecode(bytecode, filename):
+    """
+    Point *bytecode* and all code objects nested in it to *filename*.
+
+    Cache entries are shared by all classes that generate the same script, but
+    tracebacks and debuggers must find the source of *this* class.
+    """
+    if bytecode.co_filename == filename:
+        return bytecode
+
+    return bytecode.replace(
+        co_filename=filename,
+        co_consts=tuple(
+            (
+                _relocate_bytecode(const, filename)
+                if isinstance(const, types.CodeType)
+                else const
+            )
+            for const in bytecode.co_consts
+        ),
+    )
+
+
+# Filenames of the linecache entries registered by attrs in the order of their
+# registration.  Only tracked while the number of entries is bounded.
+_linecache_entries = {}
+_linecache_lock = threading.Lock()
+_linecache_counter = itertools.count(1)
+
+
+class _LazyLines:
+    """
+    Stand-in for the list of lines in a linecache entry that only splits the
+    source once somebody asks for it.
+    """
+
+    __slots__ = ("_lines", "_script")
+
+    def __init__(self, script):
+        self._script = script
+        self._lines = None
+
+    def _get(self):
+        if self._lines is None:
+            self._lines = self._script.splitlines(True)
+
+        return self._lines
+
+    def __len__(self):
+        return len(self._get())
+
+    def __getitem__(self, index):
+        return self._get()[index]
+
+    def __iter__(self):
+        return iter(self._get())
+
+    def __eq__(self, other):
+        if isinstance(other, _LazyLines):
+            return self._script == other._script
+        if isinstance(other, list):
+            return self._get() == other
+
+        return NotImplemented
+
+    __hash__ = None
+
+
 def _make_method(name, script, filename, globs, locals=None):
     """
     Create the method with the script given and return the method object.
     """
     locs = {} if locals is None else locals
 
+    # Scripts that need locals can't be precompiled.
+    if _recorded_scripts is not None and locals is None:
+        _recorded_scripts.append((name, filename, script))
+
     # In order of debuggers like PDB being able to step through the code,
     # we add a fake linecache entry.
+    if _config._linecache_policy != "off":
+        filename = _register_linecache(script, filename)
+
+    _compile_and_eval(script, globs, locs, filename)
+
+    return locs[name]
+
+
+def _make_shared_method(name, script, filename, globs):
+    """
+    Like `_make_method` but reuse the compiled code of earlier methods with
+    the same *script* and only bind it to *globs*.
+
+    Only use this for scripts whose defaults don't depend on *globs*.
+    """
+    if _recorded_scripts is not None:
+        _recorded_scripts.append((name, filename, script))
+
+    if _config._linecache_policy != "off":
+        filename = _register_linecache(script, filename)
+
+    # eval() would add them to globs too.
+    globs.setdefault("__builtins__", builtins)
+
+    code, defaults, kwdefaults = _method_template(name, script)
+    # Precompiled code already points to the source in its companion module.
+    if code.co_filename == _TEMPLATE_FILENAME:
+        code = _relocate_bytecode(code, filename)
+
+    method = types.FunctionType(code, globs, name, defaults)
+    if kwdefaults is not None:
+        method.__kwdefaults__ = dict(kwdefaults)
+
+    return method
+
+
+_TEMPLATE_FILENAME = "<attrs template>"
+
+
+@functools.lru_cache(maxsize=1024)
+def _method_template(name, script):
+    """
+    Compile *script* and return the code, defaults, and keyword-only defaults
+    of the function *name* that it defines.
+    """
+    locs = {}
+    _compile_and_eval(script, {}, locs, _TEMPLATE_FILENAME)
+    method = locs[name]
+
+    return method.__code__, method.__defaults__, method.__kwdefaults__
+
+
+def get_template_cache_info():
+    """
+    Return statistics about the cache that allows classes with the same shape
+    to share the code of their generated ``__eq__``, ``__hash__``, and
+    ``__repr__`` methods.
+
+    Returns:
+        functools._CacheInfo:
+            A named tuple with the number of *hits* and *misses*, the
+            *maxsize*, and the *currsize* of the cache -- just like
+            `functools.lru_cache`'s ``cache_info()``.
+
+    .. versionadded:: 24.3.0
+    """
+    return _method_template.cache_info()
+
+
+def _register_linecache(script, filename):
+    """
+    Register *script* in linecache according to the current policy and return
+    the filename it was registered under.
+    """
+    lines = (
+        _LazyLines(script)
+        if _config._linecache_policy == "lazy"
+        else script.splitlines(True)
+    )
+
+    max_entries = _config._linecache_max_entries
+    if max_entries is not None:
+        # Evicted filenames would be free again, so hand out a new one every
+        # time.  Otherwise the methods of an evicted class would show the source
+        # of a newer class with the same name.
+        filename = f"{filename[:-1]}-{next(_linecache_counter)}>"
+        with _linecache_lock:
+            linecache.cache[filename] = (len(script), None, lines, filename)
+            _linecache_entries[filename] = None
+
+            # Entries that linecache dropped by itself are evicted like any
+            # other, so this never grows beyond max_entries.
+            while len(_linecache_entries) > max_entries:
+                oldest = next(iter(_linecache_entries))
+                del _linecache_entries[oldest]
+                linecache.cache.pop(oldest, None)
+
+        return filename
+
     count = 1
     base_filename = filename
     while True:
-        linecache_tuple = (
-            len(script),
-            None,
-            script.splitlines(True),
-            filename,
-        )
+        linecache_tuple = (len(script), None, lines, filename)
         old_val = linecache.cache.setdefault(filename, linecache_tuple)
         if old_val == linecache_tuple:
             break
@@ -238,9 +581,40 @@ def _make_method(name, script, filename, globs, locals=None):
         filename = f"{base_filename[:-1]}-{count}>"
         count += 1
 
-    _compile_and_eval(script, globs, locs, filename)
+    return filename
+
+
+def get_linecache_footprint():
+    """
+    Return the number of `linecache` entries that *attrs* registered for
+    generated methods and that are still present, along with the total size
+    of their source code in characters.
+
+    .. versionadded:: 24.3.0
+    """
+    sizes = [
+        entry[0]
+        for filename, entry in list(linecache.cache.items())
+        if filename.startswith("<attrs generated ")
+    ]
+
+    return len(sizes), sum(sizes)
 
-    return locs[name]
+
+# Tuple classes for the attributes of attrs classes by their class names and
+# attribute names.  Classes that are created over and over with the same layout
+# share them as long as one of them is alive.
+_attr_tuple_classes = weakref.WeakValueDictionary()
+
+
+@functools.lru_cache(maxsize=None)
+def _attr_tuple_property(index):
+    """
+    Return a property that returns the item at *index*.
+
+    The properties are shared by all tuple classes.
+    """
+    return property(itemgetter(index))
 
 
 def _make_attr_tuple_class(cls_name, attr_names):
@@ -253,21 +627,17 @@ def _make_attr_tuple_class(cls_name, attr_names):
         __slots__ = ()
         x = property(itemgetter(0))
     """
-    attr_class_name = f"{cls_name}Attributes"
-    attr_class_template = [
-        f"class {attr_class_name}(tuple):",
-        "    __slots__ = ()",
-    ]
-    if attr_names:
+    key = (cls_name, tuple(attr_names))
+    attr_class = _attr_tuple_classes.get(key)
+    if attr_class is None:
+        body = {"__slots__": ()}
         for i, attr_name in enumerate(attr_names):
-            attr_class_template.append(
-                f"    {attr_name} = _attrs_property(_attrs_itemgetter({i}))"
-            )
-    else:
-        attr_class_template.append("    pass")
-    globs = {"_attrs_itemgetter": itemgetter, "_attrs_property": property}
-    _compile_and_eval("\n".join(attr_class_template), globs)
-    return globs[attr_class_name]
+            body[attr_name] = _attr_tuple_property(i)
+
+        attr_class = type(f"{cls_name}Attributes", (tuple,), body)
+        _attr_tuple_classes[key] = attr_class
+
+    return attr_class
 
 
 # Tuple class for extracted attributes from a class definition.
@@ -302,6 +672,27 @@ def _is_class_var(annot):
     return annot.startswith(_CLASSVAR_PREFIXES)
 
 
+def _detect_auto_attribs(cls, these):
+    """
+    Check whether *cls* should be collected with *auto_attribs=True* if it
+    isn't set explicitly.
+
+    That's the case unless an `attr.ib` lacks a type annotation, in which case
+    `_transform_attrs` would raise `UnannotatedAttributeError`.
+    """
+    if these is not None:
+        return True
+
+    anns = _get_annotations(cls)
+    for name, attr in cls.__dict__.items():
+        if isinstance(attr, _CountingAttr) and (
+            name not in anns or _is_class_var(anns[name])
+        ):
+            return False
+
+    return True
+
+
 def _has_own_attribute(cls, attrib_name):
     """
     Check whether *cls* defines *attrib_name* (and doesn't just inherit it).
@@ -309,6 +700,40 @@ def _has_own_attribute(cls, attrib_name):
     return attrib_name in cls.__dict__
 
 
+def _inherited_attrs(base_cls):
+    """
+    Return pairs of the attributes of *base_cls* and copies of them with
+    ``inherited=True`` that subclasses may share, or `None` if every subclass
+    needs its own copy.
+
+    The shared copies are cached on the class that owns the attributes.  Only
+    attributes whose type `resolve_types` can't change are shared, since it
+    changes the types of attributes in place.
+    """
+    attrs = getattr(base_cls, "__attrs_attrs__", ())
+    cached = getattr(base_cls, "__attrs_inherited_attrs__", None)
+    if cached is not None and cached[0] is attrs:
+        return cached[1]
+
+    pairs = tuple(
+        (
+            a,
+            (
+                (a if a.inherited else a.evolve(inherited=True))
+                if a.type is None or type(a.type) is type
+                else None
+            ),
+        )
+        for a in attrs
+    )
+    if "__attrs_attrs__" in base_cls.__dict__:
+        with contextlib.suppress(AttributeError, TypeError):
+            base_cls.__attrs_inherited_attrs__ = (attrs, pairs)
+
+    return pairs
+
+
+@_profiled("_collect_base_attrs")
 def _collect_base_attrs(cls, taken_attr_names):
     """
     Collect attr.ibs from base classes of *cls*, except *taken_attr_names*.
@@ -318,12 +743,15 @@ def _collect_base_attrs(cls, taken_attr_names):
 
     # Traverse the MRO and collect attributes.
     for base_cls in reversed(cls.__mro__[1:-1]):
-        for a in getattr(base_cls, "__attrs_attrs__", []):
+        for a, inherited_a in _inherited_attrs(base_cls):
             if a.inherited or a.name in taken_attr_names:
                 continue
 
-            a = a.evolve(inherited=True)  # noqa: PLW2901
-            base_attrs.append(a)
+            base_attrs.append(
+                a.evolve(inherited=True)
+                if inherited_a is None
+                else inherited_a
+            )
             base_attr_map[a.name] = base_cls
 
     # For each name, only keep the freshest definition i.e. the furthest at the
@@ -340,6 +768,7 @@ def _collect_base_attrs(cls, taken_attr_names):
     return filtered, base_attr_map
 
 
+@_profiled("_collect_base_attrs")
 def _collect_base_attrs_broken(cls, taken_attr_names):
     """
     Collect attr.ibs from base classes of *cls*, except *taken_attr_names*.
@@ -356,18 +785,22 @@ def _collect_base_attrs_broken(cls, taken_attr_names):
 
     # Traverse the MRO and collect attributes.
     for base_cls in cls.__mro__[1:-1]:
-        for a in getattr(base_cls, "__attrs_attrs__", []):
+        for a, inherited_a in _inherited_attrs(base_cls):
             if a.name in taken_attr_names:
                 continue
 
-            a = a.evolve(inherited=True)  # noqa: PLW2901
             taken_attr_names.add(a.name)
-            base_attrs.append(a)
+            base_attrs.append(
+                a.evolve(inherited=True)
+                if inherited_a is None
+                else inherited_a
+            )
             base_attr_map[a.name] = base_cls
 
     return base_attrs, base_attr_map
 
 
+@_profiled("_transform_attrs")
 def _transform_attrs(
     cls, these, auto_attribs, kw_only, collect_by_mro, field_transformer
 ):
@@ -584,6 +1017,7 @@ class _ClassBuilder:
         "_is_exc",
         "_on_setattr",
         "_slots",
+        "_strip_validators",
         "_weakref_slot",
         "_wrote_own_setattr",
         "_has_custom_setattr",
@@ -605,7 +1039,11 @@ class _ClassBuilder:
         on_setattr,
         has_custom_setattr,
         field_transformer,
+        strip_validators,
     ):
+        if _config._precompiled_methods:
+            _load_precompiled(cls.__module__)
+
         attrs, base_attrs, base_map = _transform_attrs(
             cls,
             these,
@@ -631,11 +1069,16 @@ class _ClassBuilder:
             # Check if the pre init method has more arguments than just `self`
             # We want to pass arguments if pre init expects arguments
             pre_init_func = cls.__attrs_pre_init__
+            import inspect
+
             pre_init_signature = inspect.signature(pre_init_func)
             self._pre_init_has_args = len(pre_init_signature.parameters) > 1
         self._has_post_init = bool(getattr(cls, "__attrs_post_init__", False))
         self._delete_attribs = not bool(these)
         self._is_exc = is_exc
+        self._strip_validators = strip_validators
+        if strip_validators and not frozen:
+            on_setattr = _strip_validate_hook(on_setattr)
         self._on_setattr = on_setattr
 
         self._has_custom_setattr = has_custom_setattr
@@ -747,11 +1190,16 @@ class _ClassBuilder:
         """
         Build and return a new class with a `__slots__` attribute.
         """
-        cd = {
-            k: v
-            for k, v in self._cls_dict.items()
-            if k not in (*tuple(self._attr_names), "__dict__", "__weakref__")
-        }
+        excluded = {*self._attr_names, "__dict__", "__weakref__"}
+        cd = {}
+        cached_properties = {}
+        for k, v in self._cls_dict.items():
+            if k in excluded:
+                continue
+
+            cd[k] = v
+            if isinstance(v, functools.cached_property):
+                cached_properties[k] = v.func
 
         # If our class doesn't have its own implementation of __setattr__
         # (either from the user or by us), check the bases, if one of them has
@@ -775,14 +1223,16 @@ class _ClassBuilder:
         existing_slots = {}
         weakref_inherited = False
         for base_cls in self._cls.__mro__[1:-1]:
-            if base_cls.__dict__.get("__weakref__", None) is not None:
+            base_dict = base_cls.__dict__
+            if base_dict.get("__weakref__", None) is not None:
                 weakref_inherited = True
-            existing_slots.update(
-                {
-                    name: getattr(base_cls, name)
-                    for name in getattr(base_cls, "__slots__", [])
-                }
-            )
+            if "__slots__" in base_dict:
+                existing_slots.update(
+                    {
+                        name: getattr(base_cls, name)
+                        for name in base_dict["__slots__"]
+                    }
+                )
 
         base_names = set(self._base_names)
 
@@ -795,16 +1245,12 @@ class _ClassBuilder:
         ):
             names += ("__weakref__",)
 
-        cached_properties = {
-            name: cached_property.func
-            for name, cached_property in cd.items()
-            if isinstance(cached_property, functools.cached_property)
-        }
-
         # Collect methods with a `__class__` reference that are shadowed in the new class.
         # To know to update them.
         additional_closure_functions_to_update = []
         if cached_properties:
+            import inspect
+
             class_annotations = _get_annotations(self._cls)
             for name, func in cached_properties.items():
                 # Add cached properties to names for slotting.
@@ -858,7 +1304,9 @@ class _ClassBuilder:
         for item in itertools.chain(
             cls.__dict__.values(), additional_closure_functions_to_update
         ):
-            if isinstance(item, (classmethod, staticmethod)):
+            if type(item) is types.FunctionType:
+                closure_cells = item.__closure__
+            elif isinstance(item, (classmethod, staticmethod)):
                 # Class- and staticmethods hide their functions inside.
                 # These might need to be rewritten as well.
                 closure_cells = getattr(item.__func__, "__closure__", None)
@@ -883,9 +1331,12 @@ class _ClassBuilder:
         return cls
 
     def add_repr(self, ns):
-        self._cls_dict["__repr__"] = self._add_method_dunders(
-            _make_repr(self._attrs, ns, self._cls)
+        attrs = self._attrs
+
+        self._add_methods(
+            ("__repr__",), lambda cls: (_make_repr(attrs, ns, cls),)
         )
+
         return self
 
     def add_str(self):
@@ -971,6 +1422,7 @@ class _ClassBuilder:
                 self._base_attr_map,
                 self._is_exc,
                 self._on_setattr,
+                self._strip_validators,
                 attrs_init=False,
             )
         )
@@ -998,28 +1450,45 @@ class _ClassBuilder:
                 self._base_attr_map,
                 self._is_exc,
                 self._on_setattr,
+                self._strip_validators,
                 attrs_init=True,
             )
         )
 
         return self
 
+    def add_validate(self):
+        attrs = self._attrs
+
+        # Classes without validators only need the method to override the
+        # one they inherit.
+        if all(a.validator is None for a in attrs) and not hasattr(
+            self._cls, "__attrs_validate__"
+        ):
+            return self
+
+        self._add_methods(
+            ("__attrs_validate__",), lambda cls: (_make_validate(cls, attrs),)
+        )
+
+        return self
+
     def add_eq(self):
-        cd = self._cls_dict
+        attrs = self._attrs
 
-        cd["__eq__"] = self._add_method_dunders(
-            _make_eq(self._cls, self._attrs)
+        self._add_methods(
+            ("__eq__", "__ne__"),
+            lambda cls: (_make_eq(cls, attrs), _make_ne()),
         )
-        cd["__ne__"] = self._add_method_dunders(_make_ne())
 
         return self
 
     def add_order(self):
-        cd = self._cls_dict
+        attrs = self._attrs
 
-        cd["__lt__"], cd["__le__"], cd["__gt__"], cd["__ge__"] = (
-            self._add_method_dunders(meth)
-            for meth in _make_order(self._cls, self._attrs)
+        self._add_methods(
+            ("__lt__", "__le__", "__gt__", "__ge__"),
+            lambda cls: _make_order(cls, attrs),
         )
 
         return self
@@ -1031,6 +1500,8 @@ class _ClassBuilder:
         sa_attrs = {}
         for a in self._attrs:
             on_setattr = a.on_setattr or self._on_setattr
+            if self._strip_validators:
+                on_setattr = _strip_validate_hook(on_setattr)
             if on_setattr and on_setattr is not setters.NO_OP:
                 sa_attrs[a.name] = a, on_setattr
 
@@ -1059,23 +1530,112 @@ class _ClassBuilder:
 
         return self
 
+    def _add_methods(self, names, make):
+        """
+        Add the methods that *make* creates for a class under *names*.
+
+        If lazy methods are enabled, only add `_LazyMethod` placeholders that
+        call *make* once any of them is accessed.
+        """
+        if _config._lazy_methods:
+            for name in names:
+                self._cls_dict[name] = _LazyMethod(name, names, make)
+
+            return
+
+        for name, method in zip(names, make(self._cls)):
+            self._cls_dict[name] = self._add_method_dunders(method)
+
     def _add_method_dunders(self, method):
         """
         Add __module__ and __qualname__ to a *method* if possible.
         """
-        with contextlib.suppress(AttributeError):
-            method.__module__ = self._cls.__module__
+        return _add_method_dunders_for(self._cls, method)
 
-        with contextlib.suppress(AttributeError):
-            method.__qualname__ = f"{self._cls.__qualname__}.{method.__name__}"
 
-        with contextlib.suppress(AttributeError):
-            method.__doc__ = (
-                "Method generated by attrs for class "
-                f"{self._cls.__qualname__}."
-            )
+class _ProfiledClassBuilder(_ClassBuilder):
+    """
+    A `_ClassBuilder` that records how long each of its steps takes.
+
+    It's only used while class creation is profiled, so that the steps of the
+    plain builder don't pay for checking whether they should be recorded.
+    """
+
+    __slots__ = ()
+
+    _create_slots_class = _profiled("_create_slots_class")(
+        _ClassBuilder._create_slots_class
+    )
+    add_repr = _profiled("add_repr")(_ClassBuilder.add_repr)
+    add_str = _profiled("add_str")(_ClassBuilder.add_str)
+    add_hash = _profiled("add_hash")(_ClassBuilder.add_hash)
+    add_init = _profiled("add_init")(_ClassBuilder.add_init)
+    add_match_args = _profiled("add_match_args")(_ClassBuilder.add_match_args)
+    add_attrs_init = _profiled("add_attrs_init")(_ClassBuilder.add_attrs_init)
+    add_validate = _profiled("add_validate")(_ClassBuilder.add_validate)
+    add_eq = _profiled("add_eq")(_ClassBuilder.add_eq)
+    add_order = _profiled("add_order")(_ClassBuilder.add_order)
+    add_setattr = _profiled("add_setattr")(_ClassBuilder.add_setattr)
+
+
+def _add_method_dunders_for(cls, method):
+    """
+    Add __module__ and __qualname__ of *cls* to a *method* if possible.
+    """
+    with contextlib.suppress(AttributeError):
+        method.__module__ = cls.__module__
+
+    with contextlib.suppress(AttributeError):
+        method.__qualname__ = f"{cls.__qualname__}.{method.__name__}"
+
+    with contextlib.suppress(AttributeError):
+        method.__doc__ = (
+            f"Method generated by attrs for class {cls.__qualname__}."
+        )
+
+    return method
+
+
+class _LazyMethod:
+    """
+    Placeholder for methods that are generated on first access.
+
+    All placeholders that share *make* form a group: once any of them is
+    accessed, *make* is called with the class that holds them and its methods
+    replace the whole group.  Therefore, the placeholders never hold a
+    reference to the original class (that is replaced by slotted classes).
+    """
+
+    __slots__ = ("_make", "_name", "_names")
+
+    def __init__(self, name, names, make):
+        self._name = name
+        self._names = names
+        self._make = make
 
-        return method
+    def __get__(self, instance, owner=None):
+        if owner is None:
+            owner = type(instance)
+
+        # The placeholder may have been inherited by a non-attrs subclass.
+        holder = next(
+            cls
+            for cls in owner.__mro__
+            if cls.__dict__.get(self._name) is self
+        )
+
+        for name, method in zip(self._names, self._make(holder)):
+            current = holder.__dict__.get(name)
+            if (
+                isinstance(current, _LazyMethod)
+                and current._make is self._make
+            ):
+                setattr(holder, name, _add_method_dunders_for(holder, method))
+
+        return holder.__dict__[self._name].__get__(instance, owner)
+
+    def __repr__(self):
+        return f"<lazy attrs method {self._name}>"
 
 
 def _determine_attrs_eq_order(cmp, eq, order, default_eq):
@@ -1200,6 +1760,7 @@ def attrs(
     field_transformer=None,
     match_args=True,
     unsafe_hash=None,
+    _strip_validators=None,
 ):
     r"""
     A class decorator that adds :term:`dunder methods` according to the
@@ -1286,6 +1847,7 @@ def attrs(
     if isinstance(on_setattr, (list, tuple)):
         on_setattr = setters.pipe(*on_setattr)
 
+    @_profiled_class
     def wrap(cls):
         is_frozen = frozen or _has_frozen_base_class(cls)
         is_exc = auto_exc is True and issubclass(cls, BaseException)
@@ -1297,7 +1859,11 @@ def attrs(
             msg = "Can't freeze a class with a custom __setattr__."
             raise ValueError(msg)
 
-        builder = _ClassBuilder(
+        builder = (
+            _ClassBuilder
+            if _profile._records is None
+            else _ProfiledClassBuilder
+        )(
             cls,
             these,
             slots,
@@ -1318,6 +1884,12 @@ def attrs(
             on_setattr,
             has_own_setattr,
             field_transformer,
+            # attrs' own classes pass False to keep checking their arguments.
+            (
+                _config._strip_validators
+                if _strip_validators is None
+                else _strip_validators
+            ),
         )
         if _determine_whether_to_implement(
             cls, repr, auto_detect, ("__repr__",)
@@ -1379,6 +1951,8 @@ def attrs(
                 msg = "Invalid value for cache_hash.  To use hash caching, init must be True."
                 raise TypeError(msg)
 
+        builder.add_validate()
+
         if (
             PY_3_10_PLUS
             and match_args
@@ -1429,9 +2003,9 @@ def _make_hash(cls, attrs, frozen, cache_hash):
     tab = "        "
 
     unique_filename = _generate_unique_filename(cls, "hash")
-    type_hash = hash(unique_filename)
-    # If eq is custom generated, we need to include the functions in globs
-    globs = {}
+    # The type hash is passed as a global so classes with the same shape
+    # generate the same script and can share its code.
+    globs = {"_type_hash": hash(unique_filename)}
 
     hash_def = "def __hash__(self"
     hash_func = "hash(("
@@ -1457,7 +2031,7 @@ def _make_hash(cls, attrs, frozen, cache_hash):
         method_lines.extend(
             [
                 indent + prefix + hash_func,
-                indent + f"        {type_hash},",
+                indent + "        _type_hash,",
             ]
         )
 
@@ -1489,7 +2063,7 @@ def _make_hash(cls, attrs, frozen, cache_hash):
         append_hash_computation_lines("return ", tab)
 
     script = "\n".join(method_lines)
-    return _make_method("__hash__", script, unique_filename, globs)
+    return _make_shared_method("__hash__", script, unique_filename, globs)
 
 
 def _add_hash(cls, attrs):
@@ -1556,7 +2130,7 @@ def _make_eq(cls, attrs):
 
     script = "\n".join(lines)
 
-    return _make_method("__eq__", script, unique_filename, globs)
+    return _make_shared_method("__eq__", script, unique_filename, globs)
 
 
 def _make_order(cls, attrs):
@@ -1680,8 +2254,8 @@ def _make_repr(attrs, ns, cls):
         "    already_repring.remove(id(self))",
     ]
 
-    return _make_method(
-        "__repr__", "\n".join(lines), unique_filename, globs=globs
+    return _make_shared_method(
+        "__repr__", "\n".join(lines), unique_filename, globs
     )
 
 
@@ -1779,8 +2353,17 @@ def validate(inst):
 
     Args:
         inst: Instance of a class with *attrs* attributes.
+
+    .. versionchanged:: 24.3.0
+       Calls the ``__attrs_validate__`` method that *attrs* generates for
+       classes with validators, which runs them all at once.
     """
-    if _config._run_validators is False:
+    if _config._run_validators is False or _config._disabled_in_context.get():
+        return
+
+    validate_all = getattr(inst.__class__, "__attrs_validate__", None)
+    if validate_all is not None:
+        validate_all(inst)
         return
 
     for a in fields(inst.__class__):
@@ -1789,6 +2372,92 @@ def validate(inst):
             v(inst, a, getattr(inst, a.name))
 
 
+# Functions that validate a column of instances per attribute with a
+# validator, by class.
+_column_validators = weakref.WeakKeyDictionary()
+
+
+def validate_many(cls, instances):
+    """
+    Validate all attributes that have a validator on all *instances* of
+    *cls* and collect the failures.
+
+    Unlike calling `attrs.validate` for each instance, this validates the
+    instances attribute by attribute, using a function per attribute with its
+    validators inlined.  This is useful for validating instances that have
+    been created with validators disabled, for example by bulk loads.
+
+    Args:
+        cls (type): An *attrs* class.
+
+        instances (~collections.abc.Iterable):
+            Instances of *cls*.  Only the attributes of *cls* are validated.
+
+    Returns:
+        list[tuple[int, attrs.Attribute, Exception]]:
+            The index of the instance in *instances*, the attribute, and the
+            exception that its validator raised for each failure, ordered by
+            attribute first.  Empty if all instances are valid.
+
+    Raises:
+        attrs.exceptions.NotAnAttrsClassError:
+            If *cls* is not an *attrs* class.
+
+    .. versionadded:: 24.3.0
+    """
+    try:
+        columns = _column_validators[cls]
+    except KeyError:
+        columns = _column_validators[cls] = [
+            (a, _make_column_validator(cls, a))
+            for a in fields(cls)
+            if a.validator is not None
+        ]
+
+    failures = []
+    if _config._run_validators is False or _config._disabled_in_context.get():
+        return failures
+
+    if not isinstance(instances, (list, tuple)):
+        instances = list(instances)
+
+    for a, validate_column in columns:
+        validate_column(a, instances, failures)
+
+    return failures
+
+
+def _make_column_validator(cls, a):
+    """
+    Return a function that runs the validator of attribute *a* on a list of
+    instances and appends failures to a list.
+    """
+    globs = {}
+    compiler = _ValidatorCompiler(globs, "__attr_validator", "inst", "attr")
+    script = "\n".join(
+        [
+            "def validate_column(attr, instances, failures):",
+            "    for index, inst in enumerate(instances):",
+            f"        value = inst.{a.name}",
+            "        try:",
+            *compiler.indent(
+                compiler.indent(
+                    compiler.indent(compiler.check(a.validator, "value"))
+                )
+            ),
+            "        except Exception as e:",
+            "            failures.append((index, attr, e))",
+        ]
+    )
+
+    return _make_shared_method(
+        "validate_column",
+        script,
+        _generate_unique_filename(cls, f"validate_many {a.name}"),
+        globs,
+    )
+
+
 def _is_slot_attr(a_name, base_attr_map):
     """
     Check if the attribute name comes from a slot class.
@@ -1809,6 +2478,7 @@ def _make_init(
     base_attr_map,
     is_exc,
     cls_on_setattr,
+    strip_validators,
     attrs_init,
 ):
     has_cls_on_setattr = (
@@ -1852,11 +2522,16 @@ def _make_init(
         is_exc,
         needs_cached_setattr,
         has_cls_on_setattr,
+        strip_validators,
         "__attrs_init__" if attrs_init else "__init__",
     )
     if cls.__module__ in sys.modules:
         # This makes typing.get_type_hints(CLS.__init__) resolve string types.
-        globs.update(sys.modules[cls.__module__].__dict__)
+        globs.update(
+            _annotation_globals(
+                sys.modules[cls.__module__].__dict__, annotations
+            )
+        )
 
     globs.update({"NOTHING": NOTHING, "attr_dict": attr_dict})
 
@@ -1876,6 +2551,90 @@ def _make_init(
     return init
 
 
+def _validator_checks(attrs, globs):
+    """
+    Return the lines that run the validators of *attrs* on ``self`` and add
+    the attributes and validators they use to *globs*.
+    """
+    checks = []
+    for a in attrs:
+        attr_name = "__attr_" + a.name
+        globs[attr_name] = a
+        # Simple validators like instance_of() are inlined.
+        compiler = _ValidatorCompiler(
+            globs, "__attr_validator_" + a.name, "self", attr_name
+        )
+        checks.extend(compiler.check(a.validator, f"self.{a.name}"))
+
+    return checks
+
+
+def _make_validate(cls, attrs):
+    """
+    Create the ``__attrs_validate__`` method that runs the validators of all
+    *attrs* like `validate`.
+    """
+    globs = {}
+    checks = _validator_checks(
+        [a for a in attrs if a.validator is not None], globs
+    )
+    script = "\n".join(
+        [
+            "def __attrs_validate__(self):",
+            *_ValidatorCompiler.indent(checks),
+        ]
+    )
+
+    return _make_shared_method(
+        "__attrs_validate__",
+        script,
+        _generate_unique_filename(cls, "validate"),
+        globs,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _identifier_re():
+    """
+    Return the pattern that matches names that a string annotation can
+    reference.
+
+    Compiled on first use to not import `re` at import time.
+    """
+    import re
+
+    return re.compile(r"[^\W\d]\w*")
+
+
+def _annotation_globals(module_globals, annotations):
+    """
+    Return the subset of *module_globals* that is necessary to resolve string
+    annotations and forward references in *annotations*.
+
+    Copying the whole module namespace into the globals of every generated
+    method would be quadratic in the number of classes per module.
+
+    Since we only have to find names that *could* be referenced, we look for
+    identifiers in the annotation strings and in the reprs of all other
+    non-class annotations (for example, ``list["Foo"]``).
+    """
+    identifier_re = _identifier_re()
+    names = set()
+    for annotation in annotations.values():
+        if annotation is None or isinstance(annotation, type):
+            continue
+
+        names.update(
+            identifier_re.findall(
+                annotation if isinstance(annotation, str) else repr(annotation)
+            )
+        )
+
+    return {
+        name: module_globals[name] for name in names if name in module_globals
+    }
+
+
 def _setattr(attr_name: str, value_var: str, has_on_setattr: bool) -> str:
     """
     Use the cached object.setattr to set *attr_name* to *value_var*.
@@ -1976,6 +2735,7 @@ def _attrs_to_init_script(
     is_exc: bool,
     needs_cached_setattr: bool,
     has_cls_on_setattr: bool,
+    strip_validators: bool,
     method_name: str,
 ) -> tuple[str, dict, dict]:
     """
@@ -2009,7 +2769,7 @@ def _attrs_to_init_script(
     annotations = {"return": None}
 
     for a in attrs:
-        if a.validator:
+        if a.validator and not strip_validators:
             attrs_to_validate.append(a)
 
         attr_name = a.name
@@ -2161,13 +2921,16 @@ def _attrs_to_init_script(
 
     if attrs_to_validate:  # we can skip this if there are no validators.
         names_for_globals["_config"] = _config
-        lines.append("if _config._run_validators is True:")
-        for a in attrs_to_validate:
-            val_name = "__attr_validator_" + a.name
-            attr_name = "__attr_" + a.name
-            lines.append(f"    {val_name}(self, {attr_name}, self.{a.name})")
-            names_for_globals[val_name] = a.validator
-            names_for_globals[attr_name] = a
+        lines.append(
+            "if _config._run_validators is True and ("
+            "_config._validation_check is None or "
+            "_config._validation_check()):"
+        )
+        lines.extend(
+            _ValidatorCompiler.indent(
+                _validator_checks(attrs_to_validate, names_for_globals)
+            )
+        )
 
     if call_post_init:
         lines.append("self.__attrs_post_init__()")
@@ -2792,8 +3555,91 @@ Converter = _add_hash(
 )
 
 
+# Classes created by make_class(..., cache=True), keyed by _make_class_key().
+_made_classes = weakref.WeakValueDictionary()
+
+
+def _make_class_key(name, attrs, bases, class_body, module, arguments):
+    """
+    Return the key that identifies a call to `make_class` in its cache or
+    `None` if any part of the call is unhashable.
+    """
+    if isinstance(attrs, dict):
+        specs = tuple(
+            (
+                attr_name,
+                _counting_attr_key(a) if isinstance(a, _CountingAttr) else a,
+            )
+            for attr_name, a in attrs.items()
+        )
+    else:
+        specs = tuple(attrs)
+
+    key = (
+        module,
+        name,
+        specs,
+        bases,
+        (
+            None
+            if class_body is None
+            else tuple((k, _typed_key(v)) for k, v in class_body.items())
+        ),
+        tuple((k, _typed_key(v)) for k, v in sorted(arguments.items())),
+        _config._strip_validators,
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+def _counting_attr_key(a):
+    """
+    Return everything but the counter of *a* as a tuple.
+
+    Values are keyed using `_typed_key`.
+    """
+    key = []
+    for slot in _CountingAttr.__slots__:
+        if slot == "counter":
+            continue
+
+        value = getattr(a, slot)
+        if slot == "metadata":
+            value = tuple(value.items())
+
+        key.append(_typed_key(value))
+
+    return tuple(key)
+
+
+def _typed_key(value):
+    """
+    Return a key for *value* that includes its type and the types of the items
+    of tuples and frozensets.
+
+    This keeps, for example, a default of ``(1,)`` apart from a default of
+    ``(True,)``, although they're equal.
+    """
+    if isinstance(value, tuple):
+        return type(value), tuple(map(_typed_key, value))
+    if isinstance(value, frozenset):
+        return type(value), frozenset(map(_typed_key, value))
+
+    return type(value), value
+
+
 def make_class(
-    name, attrs, bases=(object,), class_body=None, **attributes_arguments
+    name,
+    attrs,
+    bases=(object,),
+    class_body=None,
+    *,
+    cache=False,
+    **attributes_arguments,
 ):
     r"""
     A quick way to create a new class called *name* with *attrs*.
@@ -2814,6 +3660,14 @@ def make_class(
         class_body (dict):
             An optional dictionary of class attributes for the new class.
 
+        cache (bool):
+            If True, return the same class for repeated calls with the same
+            name, attributes, bases, class body, and arguments from the same
+            module instead of creating a new one each time.  Classes are only
+            kept in the cache while they are referenced elsewhere.  Calls with
+            unhashable parts -- for example, a list as default or in the
+            metadata -- are never cached.
+
         attributes_arguments: Passed unmodified to `attr.s`.
 
     Returns:
@@ -2822,14 +3676,30 @@ def make_class(
     .. versionadded:: 17.1.0 *bases*
     .. versionchanged:: 18.1.0 If *attrs* is ordered, the order is retained.
     .. versionchanged:: 23.2.0 *class_body*
+    .. versionadded:: 24.3.0 *cache*
     """
+    if not isinstance(attrs, (dict, list, tuple)):
+        msg = "attrs argument must be a dict or a list."
+        raise TypeError(msg)
+
+    key = None
+    if cache:
+        module = None
+        with contextlib.suppress(AttributeError, ValueError):
+            module = sys._getframe(1).f_globals.get("__name__", "__main__")
+
+        key = _make_class_key(
+            name, attrs, bases, class_body, module, attributes_arguments
+        )
+        if key is not None:
+            cls = _made_classes.get(key)
+            if cls is not None:
+                return cls
+
     if isinstance(attrs, dict):
         cls_dict = attrs
-    elif isinstance(attrs, (list, tuple)):
-        cls_dict = {a: attrib() for a in attrs}
     else:
-        msg = "attrs argument must be a dict or a list."
-        raise TypeError(msg)
+        cls_dict = {a: attrib() for a in attrs}
 
     pre_init = cls_dict.pop("__attrs_pre_init__", None)
     post_init = cls_dict.pop("__attrs_post_init__", None)
@@ -2873,24 +3743,211 @@ def make_class(
     cls.__annotations__ = {
         k: v.type for k, v in cls_dict.items() if v.type is not None
     }
+
+    if key is not None:
+        cls = _made_classes.setdefault(key, cls)
+
     return cls
 
 
+class _ValidatorCompiler:
+    """
+    Turn validators into lines of Python code that check a value inline
+    instead of calling the validator.
+
+    Validators opt in by implementing ``_compile_check(compiler, value)`` that
+    returns the lines that check the value in the expression *value*, or
+    `None` if they can't be inlined in this case.  They only have to inline
+    the check itself: if it fails, they can delegate to `call` to let the
+    validator raise its usual exception.
+
+    Validators whose check is a single expression can implement
+    ``_compile_condition(compiler, value)`` instead that returns an
+    expression that is true if the value passes.  Consecutive conditions of
+    composed validators are joined into a single ``if`` statement.
+
+    All other validators are called like usual.
+
+    Args:
+        globs (dict): Globals of the generated code that are added to.
+
+        prefix (str): Prefix for the names of added globals and locals.
+
+        inst (str): Name of the variable that holds the instance.
+
+        attr (str): Name of the variable that holds the `Attribute`.
+    """
+
+    __slots__ = ("_count", "attr", "globs", "inst", "prefix")
+
+    def __init__(self, globs, prefix, inst, attr):
+        self.globs = globs
+        self.prefix = prefix
+        self.inst = inst
+        self.attr = attr
+        self._count = 0
+
+    def name(self):
+        """
+        Return a new unique name for a global or local variable.
+        """
+        self._count += 1
+
+        return f"{self.prefix}_{self._count}"
+
+    def add_global(self, value):
+        """
+        Add *value* to the globals and return its name.
+        """
+        name = self.name()
+        self.globs[name] = value
+
+        return name
+
+    def call(self, validator, value):
+        """
+        Return the code that calls *validator* with *value*.
+        """
+        return (
+            f"{self.add_global(validator)}({self.inst}, {self.attr}, {value})"
+        )
+
+    def condition(self, validator, value):
+        """
+        Return an expression that is true if *value* passes *validator*, or
+        `None` if *validator* can't be expressed as one.
+        """
+        compile_condition = getattr(
+            type(validator), "_compile_condition", None
+        )
+        if compile_condition is None:
+            return None
+
+        return compile_condition(validator, self, value)
+
+    def check(self, validator, value):
+        """
+        Return the lines that run *validator* on *value*.
+        """
+        return self.check_all([validator], value)
+
+    def check_all(self, validators, value):
+        """
+        Return the lines that run all *validators* on *value* in order.
+
+        The conditions of consecutive validators are checked at once.  If one
+        of them fails, the validators are called in order to raise the error
+        of the first one that fails.
+        """
+        lines = []
+        pending = []
+        conditions = []
+        for validator in validators:
+            condition = self.condition(validator, value)
+            if condition is not None:
+                pending.append(validator)
+                conditions.append(condition)
+                continue
+
+            lines.extend(self._check_conditions(pending, conditions, value))
+            pending = []
+            conditions = []
+
+            compile_check = getattr(type(validator), "_compile_check", None)
+            checked = (
+                None
+                if compile_check is None
+                else compile_check(validator, self, value)
+            )
+            lines.extend(
+                [self.call(validator, value)] if checked is None else checked
+            )
+
+        lines.extend(self._check_conditions(pending, conditions, value))
+
+        return lines
+
+    def _check_conditions(self, validators, conditions, value):
+        if not conditions:
+            return []
+
+        condition = (
+            conditions[0]
+            if len(conditions) == 1
+            else " and ".join(f"({c})" for c in conditions)
+        )
+
+        return [
+            f"if not ({condition}):",
+            *self.indent([self.call(v, value) for v in validators]),
+        ]
+
+    @staticmethod
+    def indent(lines):
+        """
+        Indent *lines* to form a block.
+        """
+        return [f"    {line}" for line in lines] or ["    pass"]
+
+
+class _CompiledValidator:
+    """
+    Base class for validators that are composed of other validators.
+
+    On their first call, they compile themselves with all validators that
+    they're composed of inlined into a single function and call that from then
+    on.  Subclasses implement ``_compile_check`` like validators that can be
+    inlined.
+    """
+
+    __slots__ = ("_compiled",)
+
+    def __call__(self, inst, attr, value):
+        try:
+            compiled = self._compiled
+        except AttributeError:
+            compiled = self._compiled = _compile_validator(self)
+
+        compiled(inst, attr, value)
+
+
+def _compile_validator(validator):
+    """
+    Return a function that runs *validator* with all validators it's composed
+    of inlined.
+    """
+    globs = {}
+    compiler = _ValidatorCompiler(globs, "__attr_validator", "inst", "attr")
+    script = "\n".join(
+        [
+            "def validate(inst, attr, value):",
+            *compiler.indent(compiler.check(validator, "value")),
+        ]
+    )
+
+    # Validators of the same shape generate the same script and share its
+    # code.  The function is internal to attrs, so unlike generated methods
+    # it's neither relocated nor registered in linecache.
+    code, defaults, _ = _method_template("validate", script)
+    globs["__builtins__"] = builtins
+
+    return types.FunctionType(code, globs, "validate", defaults)
+
+
 # These are required by within this module so we define them here and merely
 # import into .validators / .converters.
 
 
-@attrs(slots=True, unsafe_hash=True)
-class _AndValidator:
+@attrs(slots=True, unsafe_hash=True, _strip_validators=False)
+class _AndValidator(_CompiledValidator):
     """
     Compose many validators to a single one.
     """
 
     _validators = attrib()
 
-    def __call__(self, inst, attr, value):
-        for v in self._validators:
-            v(inst, attr, value)
+    def _compile_check(self, compiler, value):
+        return compiler.check_all(self._validators, value)
 
 
 def and_(*validators):
@@ -2940,6 +3997,8 @@ def pipe(*converters):
 
     if not converters:
         # If the converter list is empty, pipe_converter is the identity.
+        import typing
+
         A = typing.TypeVar("A")
         pipe_converter.__annotations__.update({"val": A, "return": A})
     else:
@@ -13,11 +13,11 @@ from ._funcs import astuple as _astuple
 from ._make import (
     _DEFAULT_ON_SETATTR,
     NOTHING,
+    _detect_auto_attribs,
     _frozen_setattrs,
     attrib,
     attrs,
 )
-from .exceptions import UnannotatedAttributeError
 
 
 def define(
@@ -390,13 +390,10 @@ def define(
                 on_setattr = setters.NO_OP
                 break
 
-        if auto_attribs is not None:
-            return do_it(cls, auto_attribs)
+        if auto_attribs is None:
+            return do_it(cls, _detect_auto_attribs(cls, these))
 
-        try:
-            return do_it(cls, True)
-        except UnannotatedAttributeError:
-            return do_it(cls, False)
+        return do_it(cls, auto_attribs)
 
     # maybe_cls's type depends on the usage of the decorator.  It's a class
     # if it's used as `@attrs` but `None` if used as `@attrs()`.
@@ -0,0 +1,72 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Ahead-of-time generation of companion modules with precompiled methods.
+
+See `attrs.set_precompiled_methods`.
+"""
+
+import importlib
+
+from pathlib import Path
+
+from ._make import _fingerprint, _record_scripts
+
+
+def _generate_companion(module_name):
+    """
+    Import *module_name* and write the companion module with the methods of
+    its *attrs* classes next to it.
+
+    Return the path of the companion module.
+    """
+    with _record_scripts() as records:
+        module = importlib.import_module(module_name)
+
+    path = Path(module.__file__).resolve()
+    if path.name == "__init__.py":
+        path = path.parent
+    path = path.with_name(
+        f"{module_name.rpartition('.')[2]}_attrs_generated.py"
+    )
+
+    path.write_text(_companion_source(module_name, records), encoding="utf-8")
+
+    return str(path)
+
+
+def _companion_source(module_name, records):
+    """
+    Return the source code of the companion module of *module_name* for the
+    recorded scripts of its classes.
+    """
+    prefix = f"{module_name}."
+    lines = [
+        f"# Generated by `python -m attrs generate {module_name}`.",
+        "# Don't edit, generate it again after changing the classes instead.",
+    ]
+    factories = {}
+    for name, filename, script in records:
+        # Filenames look like "<attrs generated init module.Class>".
+        if not filename.split(" ", 3)[-1].startswith(prefix):
+            continue
+
+        fingerprint = _fingerprint(script)
+        if fingerprint in factories:
+            continue
+
+        factory = factories[fingerprint] = f"_{len(factories)}"
+        lines.extend(["", "", f"def {factory}():"])
+        lines.extend(
+            f"    {line}" if line else "" for line in script.splitlines()
+        )
+        lines.extend(["", f"    return {name}"])
+
+    lines.extend(["", "", "precompiled = {"])
+    lines.extend(
+        f'    "{fingerprint}": {factory},'
+        for fingerprint, factory in factories.items()
+    )
+    lines.append("}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,160 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Opt-in timing of the phases of class creation.
+"""
+
+import atexit
+import contextlib
+import functools
+import os
+import sys
+import threading
+import time
+
+
+# List of (class, phase, seconds) tuples while recording, None otherwise.
+_records = None
+_current = threading.local()
+
+
+def _profiled(phase):
+    """
+    Record the time the decorated function takes as *phase* of the class
+    that is currently being created.
+    """
+
+    def wrap(func):
+        @functools.wraps(func)
+        def profiled(*args, **kw):
+            records = _records
+            if records is None:
+                return func(*args, **kw)
+
+            start = time.perf_counter()
+            try:
+                return func(*args, **kw)
+            finally:
+                records.append(
+                    (
+                        getattr(_current, "cls", None),
+                        phase,
+                        time.perf_counter() - start,
+                    )
+                )
+
+        return profiled
+
+    return wrap
+
+
+def _profiled_class(func):
+    """
+    Record the total time the decorated function takes to create the class
+    that is passed as its first argument.
+
+    All phases that are recorded meanwhile are attributed to it.
+    """
+
+    @functools.wraps(func)
+    def profiled(cls, *args, **kw):
+        records = _records
+        if records is None:
+            return func(cls, *args, **kw)
+
+        outer = getattr(_current, "cls", None)
+        name = _current.cls = f"{cls.__module__}.{cls.__qualname__}"
+        start = time.perf_counter()
+        try:
+            return func(cls, *args, **kw)
+        finally:
+            records.append((name, "total", time.perf_counter() - start))
+            _current.cls = outer
+
+    return profiled
+
+
+@contextlib.contextmanager
+def profile_class_creation():
+    """
+    Record how long the phases of creating *attrs* classes take while the
+    context manager is active.
+
+    The recorded phases are ``total`` for the whole decoration,
+    ``_transform_attrs`` for collecting the attributes,
+    ``_collect_base_attrs`` for collecting the inherited attributes, each
+    ``add_*`` step of the class builder, ``_create_slots_class`` for creating
+    slotted classes, and ``compile`` for each compilation of generated code.
+    Phases can be nested in each other.
+
+    Setting the ``ATTRS_PROFILE`` environment variable to a non-empty
+    value records the whole run of a program and prints a report to standard
+    error when it exits.
+
+    Yields:
+        list[tuple[str | None, str, float]]:
+            A list that is filled with a tuple of the class' fully qualified
+            name, the name of the phase, and its duration in seconds for each
+            recorded phase.  The class is `None` for code that is compiled
+            outside of class creation, e.g. for lazy methods.
+
+    .. versionadded:: 24.3.0
+    """
+    global _records
+
+    outer = _records
+    records = []
+    _records = records
+    try:
+        yield records
+    finally:
+        _records = outer
+        if outer is not None:
+            outer.extend(records)
+
+
+def _format_report(records, limit=10):
+    """
+    Return a report of the *limit* slowest classes and the slowest phases in
+    *records*.
+    """
+    count_classes = 0
+    totals = {}
+    phases = {}
+    for cls, phase, seconds in records:
+        if phase == "total":
+            count_classes += 1
+            totals[cls] = totals.get(cls, 0) + seconds
+        else:
+            count, phase_seconds = phases.get(phase, (0, 0))
+            phases[phase] = (count + 1, phase_seconds + seconds)
+
+    lines = [
+        f"Created {count_classes} classes in {sum(totals.values()) * 1000:.2f}ms.",
+        "",
+        "Slowest classes:",
+    ]
+    lines.extend(
+        f"  {seconds * 1000:10.3f}ms  {cls}"
+        for cls, seconds in sorted(
+            totals.items(), key=lambda item: item[1], reverse=True
+        )[:limit]
+    )
+    lines.extend(["", "Slowest phases:"])
+    lines.extend(
+        f"  {seconds * 1000:10.3f}ms  {count:7d}x  {phase}"
+        for phase, (count, seconds) in sorted(
+            phases.items(), key=lambda item: item[1][1], reverse=True
+        )[:limit]
+    )
+
+    return "\n".join(lines)
+
+
+def _report_at_exit(records):
+    print(_format_report(records), file=sys.stderr)  # noqa: T201
+
+
+if os.environ.get("ATTRS_PROFILE"):
+    _records = []
+    atexit.register(_report_at_exit, _records)
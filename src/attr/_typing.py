@@ -0,0 +1,14 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Runtime helpers that need `typing`, which is only imported on first use.
+"""
+
+from typing import Protocol
+
+
+class AttrsInstance(Protocol):
+    pass
+
+
+AttrsInstance.__module__ = "attr"
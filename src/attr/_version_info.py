@@ -8,7 +8,7 @@ from ._make import attrib, attrs
 
 
 @total_ordering
-@attrs(eq=False, order=False, slots=True, frozen=True)
+@attrs(eq=False, order=False, slots=True, frozen=True, _strip_validators=False)
 class VersionInfo:
     """
     A version object that can be compared to tuple of length 1--4:
@@ -23,6 +23,10 @@ def pipe(*setters):
 
         return rv
 
+    # Keep the setters so they can be taken apart again when validators are
+    # stripped.
+    wrapped_pipe._setters = setters
+
     return wrapped_pipe
 
 
@@ -48,6 +52,10 @@ def validate(instance, attrib, new_value):
     if not v:
         return new_value
 
+    check = _config._validation_check
+    if check is not None and not check():
+        return new_value
+
     v(instance, attrib, new_value)
 
     return new_value
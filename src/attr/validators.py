@@ -4,14 +4,19 @@
 Commonly useful validators.
 """
 
+import abc
 import operator
 import re
+import sys
+import threading
+import time
 
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 from re import Pattern
 
+from . import _config
 from ._config import get_run_validators, set_run_validators
-from ._make import _AndValidator, and_, attrib, attrs
+from ._make import _AndValidator, _CompiledValidator, and_, attrib, attrs
 from .converters import default_if_none
 from .exceptions import NotCallableError
 
@@ -21,10 +26,13 @@ __all__ = [
     "deep_iterable",
     "deep_mapping",
     "disabled",
+    "disabled_in_context",
     "ge",
     "get_disabled",
+    "get_sampling",
     "gt",
     "in_",
+    "in_range",
     "instance_of",
     "is_callable",
     "le",
@@ -36,6 +44,7 @@ __all__ = [
     "optional",
     "or_",
     "set_disabled",
+    "set_sampling",
 ]
 
 
@@ -62,11 +71,14 @@ def get_disabled():
     Return a bool indicating whether validators are currently disabled or not.
 
     Returns:
-        bool:`True` if validators are currently disabled.
+        bool:
+            `True` if validators are currently disabled, either globally or
+            in the current context.
 
     .. versionadded:: 21.3.0
+    .. versionchanged:: 24.3.0 Takes `disabled_in_context` into account.
     """
-    return not get_run_validators()
+    return not get_run_validators() or _config._disabled_in_context.get()
 
 
 @contextmanager
@@ -76,7 +88,8 @@ def disabled():
 
     .. warning::
 
-        This context manager is not thread-safe!
+        This context manager is not thread-safe!  Use `disabled_in_context`
+        to only disable validators in the current thread or asyncio task.
 
     .. versionadded:: 21.3.0
     """
@@ -87,7 +100,192 @@ def disabled():
         set_run_validators(True)
 
 
-@attrs(repr=False, slots=True, unsafe_hash=True)
+# The sampler that set_sampling() installed and the number of active
+# disabled_in_context() blocks, which are combined into
+# _config._validation_check.
+_sampler = None
+_contexts_disabled = 0
+_validation_check_lock = threading.Lock()
+
+
+def _update_validation_check():
+    """
+    Combine sampling and context-local disabling into a single callable, or
+    `None` if neither is active.
+    """
+    sampler = _sampler
+    if not _contexts_disabled:
+        _config._validation_check = sampler
+        return
+
+    disabled_in_context = _config._disabled_in_context.get
+    if sampler is None:
+
+        def check():
+            return not disabled_in_context()
+
+    else:
+
+        def check():
+            return not disabled_in_context() and sampler()
+
+    _config._validation_check = check
+
+
+@contextmanager
+def disabled_in_context():
+    """
+    Context manager that disables running validators only in the current
+    thread or asyncio task -- or more precisely, in the current
+    `contextvars.Context`.
+
+    Unlike `disabled`, it's safe to use while other threads and tasks
+    create instances.  They keep validating.
+
+    While no such context is active anywhere, it doesn't add any overhead
+    to creating instances.
+
+    .. versionadded:: 24.3.0
+    """
+    global _contexts_disabled
+
+    token = _config._disabled_in_context.set(True)
+    with _validation_check_lock:
+        _contexts_disabled += 1
+        _update_validation_check()
+    try:
+        yield
+    finally:
+        with _validation_check_lock:
+            _contexts_disabled -= 1
+            _update_validation_check()
+        _config._disabled_in_context.reset(token)
+
+
+class _Sampler:
+    """
+    Decide whether to run validators: for a *rate* fraction of the times it's
+    asked, and at most *max_per_second* times per second on average.
+    """
+
+    __slots__ = (
+        "_cost",
+        "_credit",
+        "_earned",
+        "_last",
+        "_tokens",
+        "max_per_second",
+        "rate",
+    )
+
+    def __init__(self, rate, max_per_second):
+        self.rate = rate
+        self.max_per_second = max_per_second
+        # Every call earns *rate* of a validation and every validation costs
+        # one, so exactly a *rate* fraction of calls validates.  Count in
+        # integers to not lose any of it to rounding.
+        self._earned, self._cost = rate.as_integer_ratio()
+        # Validate the first instance.
+        self._credit = self._cost - self._earned
+        self._tokens = max_per_second
+        self._last = time.monotonic()
+
+    def __call__(self):
+        self._credit += self._earned
+        if self._credit < self._cost:
+            return False
+
+        self._credit -= self._cost
+        if self.max_per_second is None:
+            return True
+
+        # Token bucket that holds up to one second's worth of validations.
+        now = time.monotonic()
+        tokens = min(
+            self.max_per_second,
+            self._tokens + (now - self._last) * self.max_per_second,
+        )
+        self._last = now
+        if tokens < 1:
+            self._tokens = tokens
+            return False
+
+        self._tokens = tokens - 1
+
+        return True
+
+
+def set_sampling(rate=1.0, *, max_per_second=None):
+    """
+    Globally only run the validators of a sample of instances.
+
+    By default, validators are run for every instance.  Sampling them allows
+    to keep catching invalid data in production at a fraction of the cost of
+    validating everything.
+
+    Sampling applies to the validators that are run by ``__init__`` and by
+    `attrs.setters.validate`.  Explicit calls to `attrs.validate` always
+    validate.
+
+    Args:
+        rate (float):
+            The fraction of instances whose validators are run, between 0
+            (exclusive) and 1.  The instances are picked deterministically,
+            starting with the first one: each instance adds *rate* to a
+            counter and is validated whenever the counter reaches 1, which
+            then subtracts 1 from it.  For example, with a rate of 0.75, three
+            of every four instances are validated.
+
+        max_per_second (float | None):
+            If not `None`, run validators at most this many times per second
+            on average, in bursts of up to *max_per_second*.
+
+    Pass no arguments to run all validators again.
+
+    .. warning::
+
+        This function is not thread-safe and the sampling is only
+        approximate if multiple threads create instances concurrently.
+
+    .. versionadded:: 24.3.0
+    """
+    if not 0 < rate <= 1:
+        msg = "'rate' must be between 0 and 1."
+        raise ValueError(msg)
+    if max_per_second is not None and max_per_second <= 0:
+        msg = "'max_per_second' must be positive."
+        raise ValueError(msg)
+
+    global _sampler
+
+    with _validation_check_lock:
+        _sampler = (
+            None
+            if rate == 1 and max_per_second is None
+            else _Sampler(rate, max_per_second)
+        )
+        _update_validation_check()
+
+
+def get_sampling():
+    """
+    Return how validators are sampled.
+
+    Returns:
+        tuple[float, float | None]:
+            The *rate* and *max_per_second* that were passed to
+            `set_sampling`.
+
+    .. versionadded:: 24.3.0
+    """
+    sampler = _sampler
+    if sampler is None:
+        return (1.0, None)
+
+    return (sampler.rate, sampler.max_per_second)
+
+
+@attrs(repr=False, slots=True, unsafe_hash=True, _strip_validators=False)
 class _InstanceOfValidator:
     type = attrib()
 
@@ -107,6 +305,9 @@ class _InstanceOfValidator:
     def __repr__(self):
         return f"<instance_of validator for type {self.type!r}>"
 
+    def _compile_condition(self, compiler, value):
+        return f"isinstance({value}, {compiler.add_global(self.type)})"
+
 
 def instance_of(type):
     """
@@ -125,7 +326,7 @@ def instance_of(type):
     return _InstanceOfValidator(type)
 
 
-@attrs(repr=False, frozen=True, slots=True)
+@attrs(repr=False, frozen=True, slots=True, _strip_validators=False)
 class _MatchesReValidator:
     pattern = attrib()
     match_func = attrib()
@@ -195,19 +396,19 @@ def matches_re(regex, flags=0, func=None):
     return _MatchesReValidator(pattern, match_func)
 
 
-@attrs(repr=False, slots=True, unsafe_hash=True)
-class _OptionalValidator:
+@attrs(repr=False, slots=True, unsafe_hash=True, _strip_validators=False)
+class _OptionalValidator(_CompiledValidator):
     validator = attrib()
 
-    def __call__(self, inst, attr, value):
-        if value is None:
-            return
-
-        self.validator(inst, attr, value)
-
     def __repr__(self):
         return f"<optional validator for {self.validator!r} or None>"
 
+    def _compile_check(self, compiler, value):
+        return [
+            f"if {value} is not None:",
+            *compiler.indent(compiler.check(self.validator, value)),
+        ]
+
 
 def optional(validator):
     """
@@ -230,17 +431,27 @@ def optional(validator):
     return _OptionalValidator(validator)
 
 
-@attrs(repr=False, slots=True, unsafe_hash=True)
+@attrs(repr=False, slots=True, unsafe_hash=True, _strip_validators=False)
 class _InValidator:
     options = attrib()
     _original_options = attrib(hash=False)
+    # A frozenset of the options for fast lookups if they're all hashable,
+    # the options themselves otherwise.
+    _lookup_options = attrib(eq=False)
 
     def __call__(self, inst, attr, value):
         try:
-            in_options = value in self.options
-        except TypeError:  # e.g. `1 in "abc"`
+            in_options = value in self._lookup_options
+        except TypeError:  # e.g. `1 in "abc"` or an unhashable value
             in_options = False
 
+        if not in_options and self._lookup_options is not self.options:
+            # Unhashable values can still be equal to an option.
+            try:
+                in_options = value in self.options
+            except TypeError:
+                in_options = False
+
         if not in_options:
             msg = f"'{attr.name}' must be in {self._original_options!r} (got {value!r})"
             raise ValueError(
@@ -253,6 +464,18 @@ class _InValidator:
     def __repr__(self):
         return f"<in_ validator with options {self._original_options!r}>"
 
+    def _compile_check(self, compiler, value):
+        in_options = compiler.name()
+        lookup_options = compiler.add_global(self._lookup_options)
+        return [
+            "try:",
+            f"    {in_options} = {value} in {lookup_options}",
+            "except TypeError:",
+            f"    {in_options} = False",
+            f"if not {in_options}:",
+            f"    {compiler.call(self, value)}",
+        ]
+
 
 def in_(options):
     """
@@ -263,7 +486,9 @@ def in_(options):
     support that operation.
 
     To keep the validator hashable, dicts, lists, and sets are transparently
-    transformed into a `tuple`.
+    transformed into a `tuple`.  If all options of a dict, list, set, or
+    tuple are hashable, they're also looked up in a `frozenset`, so checking
+    large sets of options is fast.
 
     Args:
         options: Allowed options.
@@ -281,15 +506,23 @@ def in_(options):
     .. versionchanged:: 24.1.0
        *options* that are a list, dict, or a set are now transformed into a
        tuple to keep the validator hashable.
+    .. versionchanged:: 24.3.0
+       Hashable options of a dict, list, set, or tuple are looked up in a
+       frozenset instead of being searched linearly.
     """
     repr_options = options
     if isinstance(options, (list, dict, set)):
         options = tuple(options)
 
-    return _InValidator(options, repr_options)
+    lookup_options = options
+    if isinstance(options, tuple):
+        with suppress(TypeError):
+            lookup_options = frozenset(options)
 
+    return _InValidator(options, repr_options, lookup_options)
 
-@attrs(repr=False, slots=False, unsafe_hash=True)
+
+@attrs(repr=False, slots=False, unsafe_hash=True, _strip_validators=False)
 class _IsCallableValidator:
     def __call__(self, inst, attr, value):
         """
@@ -327,22 +560,120 @@ def is_callable():
     return _IsCallableValidator()
 
 
-@attrs(repr=False, slots=True, unsafe_hash=True)
-class _DeepIterable:
+# Types of the members of array.array by typecode.
+_ARRAY_TYPES = dict.fromkeys("bBhHiIlLqQ", int)
+_ARRAY_TYPES.update(dict.fromkeys("fd", float))
+_ARRAY_TYPES.update(dict.fromkeys("uw", str))
+
+
+def _summarize_members(validator):
+    """
+    Return the type checks and bounds that *validator* is composed of if
+    they're the only checks it does, `None` otherwise.
+
+    Only types whose `isinstance` checks are equivalent to `issubclass` checks
+    of the type of the value are summarized.
+    """
+    type_checks = []
+    bounds = []
+    for v in (
+        validator._validators
+        if isinstance(validator, _AndValidator)
+        else [validator]
+    ):
+        if type(v) is _NumberValidator:
+            bounds.append((v.compare_func, v.bound))
+            continue
+
+        if type(v) is _InRangeValidator:
+            bounds.append((v.lower.compare_func, v.lower.bound))
+            bounds.append((v.upper.compare_func, v.upper.bound))
+            continue
+
+        if type(v) is not _InstanceOfValidator:
+            return None
+
+        types = v.type if isinstance(v.type, tuple) else (v.type,)
+        if not all(type(t) in (type, abc.ABCMeta) for t in types):
+            return None
+
+        type_checks.append(types)
+
+    return tuple(type_checks), tuple(bounds)
+
+
+def _members_pass(value, type_checks, bounds):
+    """
+    Return whether all members of *value* pass *type_checks* and *bounds*
+    without calling validators for each of them.
+
+    Containers whose members have a single known type -- `array.array` and
+    one-dimensional NumPy arrays -- are checked in constant time, bounds on
+    NumPy arrays using their vectorized ``min()`` and ``max()``.
+
+    `False` means that the members have to be validated one by one, either
+    because one of them fails or because *value* isn't supported.
+    """
+    try:
+        cls = type(value)
+        if cls is getattr(sys.modules.get("array"), "array", None):
+            if bounds:
+                return False
+            member_type = _ARRAY_TYPES.get(value.typecode, object)
+        elif (
+            cls is getattr(sys.modules.get("numpy"), "ndarray", None)
+            and value.ndim == 1
+            and value.dtype.kind in "biufSU"
+        ):
+            member_type = value.dtype.type
+            if bounds and value.size:
+                if value.dtype.kind not in "iuf":
+                    return False
+                low = value.min()
+                high = value.max()
+                for compare, bound in bounds:
+                    if not (compare(low, bound) and compare(high, bound)):
+                        return False
+        else:
+            return False
+
+        return all(issubclass(member_type, types) for types in type_checks)
+    except Exception:  # noqa: BLE001
+        return False
+
+
+@attrs(repr=False, slots=True, unsafe_hash=True, _strip_validators=False)
+class _DeepIterable(_CompiledValidator):
     member_validator = attrib(validator=is_callable())
     iterable_validator = attrib(
         default=None, validator=optional(is_callable())
     )
 
-    def __call__(self, inst, attr, value):
-        """
-        We use a callable class to be able to change the ``__repr__``.
-        """
-        if self.iterable_validator is not None:
-            self.iterable_validator(inst, attr, value)
-
-        for member in value:
-            self.member_validator(inst, attr, member)
+    def _compile_check(self, compiler, value):
+        lines = (
+            []
+            if self.iterable_validator is None
+            else compiler.check(self.iterable_validator, value)
+        )
+        member = compiler.name()
+        loop = [
+            f"for {member} in {value}:",
+            *compiler.indent(compiler.check(self.member_validator, member)),
+        ]
+
+        summary = _summarize_members(self.member_validator)
+        if summary is None:
+            return [*lines, *loop]
+
+        members_pass = compiler.add_global(_members_pass)
+        type_checks = compiler.add_global(summary[0])
+        bounds = compiler.add_global(summary[1])
+
+        return [
+            *lines,
+            f"if not {members_pass}({value}, {type_checks}, {bounds}):",
+            *compiler.indent(loop),
+        ]
 
     def __repr__(self):
         iterable_identifier = (
@@ -376,22 +707,32 @@ def deep_iterable(member_validator, iterable_validator=None):
     return _DeepIterable(member_validator, iterable_validator)
 
 
-@attrs(repr=False, slots=True, unsafe_hash=True)
-class _DeepMapping:
+@attrs(repr=False, slots=True, unsafe_hash=True, _strip_validators=False)
+class _DeepMapping(_CompiledValidator):
     key_validator = attrib(validator=is_callable())
     value_validator = attrib(validator=is_callable())
     mapping_validator = attrib(default=None, validator=optional(is_callable()))
 
-    def __call__(self, inst, attr, value):
-        """
-        We use a callable class to be able to change the ``__repr__``.
-        """
-        if self.mapping_validator is not None:
-            self.mapping_validator(inst, attr, value)
-
-        for key in value:
-            self.key_validator(inst, attr, key)
-            self.value_validator(inst, attr, value[key])
+    def _compile_check(self, compiler, value):
+        lines = (
+            []
+            if self.mapping_validator is None
+            else compiler.check(self.mapping_validator, value)
+        )
+        key = compiler.name()
+        member = compiler.name()
+
+        return [
+            *lines,
+            f"for {key} in {value}:",
+            *compiler.indent(
+                [
+                    *compiler.check(self.key_validator, key),
+                    f"{member} = {value}[{key}]",
+                    *compiler.check(self.value_validator, member),
+                ]
+            ),
+        ]
 
     def __repr__(self):
         return f"<deep_mapping validator for objects mapping {self.key_validator!r} to {self.value_validator!r}>"
@@ -417,7 +758,7 @@ def deep_mapping(key_validator, value_validator, mapping_validator=None):
     return _DeepMapping(key_validator, value_validator, mapping_validator)
 
 
-@attrs(repr=False, frozen=True, slots=True)
+@attrs(repr=False, frozen=True, slots=True, _strip_validators=False)
 class _NumberValidator:
     bound = attrib()
     compare_op = attrib()
@@ -434,6 +775,20 @@ class _NumberValidator:
     def __repr__(self):
         return f"<Validator for x {self.compare_op} {self.bound}>"
 
+    def _compile_condition(self, compiler, value):
+        if _COMPARE_FUNCS.get(self.compare_op) is not self.compare_func:
+            return None
+
+        return f"{value} {self.compare_op} {compiler.add_global(self.bound)}"
+
+
+_COMPARE_FUNCS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">=": operator.ge,
+    ">": operator.gt,
+}
+
 
 def lt(val):
     """
@@ -495,7 +850,66 @@ def gt(val):
     return _NumberValidator(val, ">", operator.gt)
 
 
-@attrs(repr=False, frozen=True, slots=True)
+@attrs(repr=False, frozen=True, slots=True, _strip_validators=False)
+class _InRangeValidator:
+    lower = attrib()
+    upper = attrib()
+
+    def __call__(self, inst, attr, value):
+        """
+        We use a callable class to be able to change the ``__repr__``.
+        """
+        lower = self.lower
+        upper = self.upper
+        if not (
+            lower.compare_func(value, lower.bound)
+            and upper.compare_func(value, upper.bound)
+        ):
+            lower(inst, attr, value)
+            upper(inst, attr, value)
+
+    def __repr__(self):
+        lower_op = "<" if self.lower.compare_op == ">" else "<="
+        return (
+            f"<in_range validator for {self.lower.bound} {lower_op} x "
+            f"{self.upper.compare_op} {self.upper.bound}>"
+        )
+
+    def _compile_condition(self, compiler, value):
+        lower = compiler.condition(self.lower, value)
+        upper = compiler.condition(self.upper, value)
+        if lower is None or upper is None:
+            return None
+
+        return f"{lower} and {upper}"
+
+
+def in_range(lo, hi, *, lo_inclusive=True, hi_inclusive=False):
+    """
+    A validator that raises `ValueError` if the initializer is called with a
+    number outside of the range from *lo* to *hi*.
+
+    By default, the range includes *lo* and excludes *hi* like `range`.  It's
+    equivalent to combining `ge` or `gt` with `le` or `lt` using `and_`, and
+    raises the same errors.
+
+    Args:
+        lo: Lower bound for values.
+
+        hi: Upper bound for values.
+
+        lo_inclusive (bool): Whether *lo* is a valid value.
+
+        hi_inclusive (bool): Whether *hi* is a valid value.
+
+    .. versionadded:: 24.3.0
+    """
+    return _InRangeValidator(
+        ge(lo) if lo_inclusive else gt(lo), le(hi) if hi_inclusive else lt(hi)
+    )
+
+
+@attrs(repr=False, frozen=True, slots=True, _strip_validators=False)
 class _MaxLengthValidator:
     max_length = attrib()
 
@@ -524,7 +938,7 @@ def max_len(length):
     return _MaxLengthValidator(length)
 
 
-@attrs(repr=False, frozen=True, slots=True)
+@attrs(repr=False, frozen=True, slots=True, _strip_validators=False)
 class _MinLengthValidator:
     min_length = attrib()
 
@@ -553,7 +967,7 @@ def min_len(length):
     return _MinLengthValidator(length)
 
 
-@attrs(repr=False, slots=True, unsafe_hash=True)
+@attrs(repr=False, slots=True, unsafe_hash=True, _strip_validators=False)
 class _SubclassOfValidator:
     type = attrib()
 
@@ -591,7 +1005,7 @@ def _subclass_of(type):
     return _SubclassOfValidator(type)
 
 
-@attrs(repr=False, slots=True, unsafe_hash=True)
+@attrs(repr=False, slots=True, unsafe_hash=True, _strip_validators=False)
 class _NotValidator:
     validator = attrib()
     msg = attrib(
@@ -664,19 +1078,34 @@ def not_(validator, *, msg=None, exc_types=(ValueError, TypeError)):
     return _NotValidator(validator, msg, exc_types)
 
 
-@attrs(repr=False, slots=True, unsafe_hash=True)
-class _OrValidator:
+@attrs(repr=False, slots=True, unsafe_hash=True, _strip_validators=False)
+class _OrValidator(_CompiledValidator):
     validators = attrib()
 
-    def __call__(self, inst, attr, value):
+    def _compile_check(self, compiler, value):
+        satisfied = compiler.name()
+        lines = [f"{satisfied} = False"]
         for v in self.validators:
-            try:
-                v(inst, attr, value)
-            except Exception:  # noqa: BLE001, PERF203, S112
-                continue
-            else:
-                return
+            lines.extend(
+                [
+                    f"if not {satisfied}:",
+                    "    try:",
+                    *compiler.indent(
+                        compiler.indent(compiler.check(v, value))
+                    ),
+                    f"        {satisfied} = True",
+                    "    except Exception:",
+                    "        pass",
+                ]
+            )
+
+        return [
+            *lines,
+            f"if not {satisfied}:",
+            f"    {compiler.add_global(self._fail)}({value})",
+        ]
 
+    def _fail(self, value):
         msg = f"None of {self.validators!r} satisfied for value {value!r}"
         raise ValueError(msg)
 
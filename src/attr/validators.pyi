@@ -26,7 +26,12 @@ _M = TypeVar("_M", bound=Mapping)
 
 def set_disabled(run: bool) -> None: ...
 def get_disabled() -> bool: ...
+def set_sampling(
+    rate: float = ..., *, max_per_second: float | None = ...
+) -> None: ...
+def get_sampling() -> tuple[float, float | None]: ...
 def disabled() -> ContextManager[None]: ...
+def disabled_in_context() -> ContextManager[None]: ...
 
 # To be more precise on instance_of use some overloads.
 # If there are more than 3 items in the tuple then we fall back to Any
@@ -72,6 +77,9 @@ def lt(val: _T) -> _ValidatorType[_T]: ...
 def le(val: _T) -> _ValidatorType[_T]: ...
 def ge(val: _T) -> _ValidatorType[_T]: ...
 def gt(val: _T) -> _ValidatorType[_T]: ...
+def in_range(
+    lo: _T, hi: _T, *, lo_inclusive: bool = ..., hi_inclusive: bool = ...
+) -> _ValidatorType[_T]: ...
 def max_len(length: int) -> _ValidatorType[_T]: ...
 def min_len(length: int) -> _ValidatorType[_T]: ...
 def not_(
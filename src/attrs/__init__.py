@@ -3,28 +3,39 @@
 from attr import (
     NOTHING,
     Attribute,
-    AttrsInstance,
     Converter,
     Factory,
     _make_getattr,
     assoc,
-    cmp_using,
     define,
     evolve,
     field,
     fields,
     fields_dict,
     frozen,
+    get_bytecode_cache,
+    get_lazy_methods,
+    get_linecache_footprint,
+    get_linecache_policy,
+    get_precompiled_methods,
+    get_strip_validators,
+    get_template_cache_info,
     has,
     make_class,
     mutable,
+    profile_class_creation,
+    resolve_module_types,
     resolve_types,
+    set_bytecode_cache,
+    set_lazy_methods,
+    set_linecache_policy,
+    set_precompiled_methods,
+    set_strip_validators,
     validate,
+    validate_many,
 )
 from attr._next_gen import asdict, astuple
 
-from . import converters, exceptions, filters, setters, validators
-
 
 __all__ = [
     "__author__",
@@ -54,14 +65,40 @@ __all__ = [
     "fields",
     "filters",
     "frozen",
+    "get_bytecode_cache",
+    "get_lazy_methods",
+    "get_linecache_footprint",
+    "get_linecache_policy",
+    "get_precompiled_methods",
+    "get_strip_validators",
+    "get_template_cache_info",
     "has",
     "make_class",
     "mutable",
     "NOTHING",
+    "profile_class_creation",
+    "resolve_module_types",
     "resolve_types",
+    "set_bytecode_cache",
+    "set_lazy_methods",
+    "set_linecache_policy",
+    "set_precompiled_methods",
+    "set_strip_validators",
     "setters",
     "validate",
+    "validate_many",
     "validators",
 ]
 
-__getattr__ = _make_getattr(__name__)
+__getattr__ = _make_getattr(
+    __name__,
+    {
+        "AttrsInstance": ("attr._typing", "AttrsInstance"),
+        "cmp_using": ("attr._cmp", "cmp_using"),
+        "converters": ("attrs.converters", None),
+        "exceptions": ("attrs.exceptions", None),
+        "filters": ("attrs.filters", None),
+        "setters": ("attrs.setters", None),
+        "validators": ("attrs.validators", None),
+    },
+)
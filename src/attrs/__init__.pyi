@@ -32,12 +32,27 @@ from attr import Factory as Factory
 from attr import fields as fields
 from attr import fields_dict as fields_dict
 from attr import filters as filters
+from attr import get_bytecode_cache as get_bytecode_cache
+from attr import get_lazy_methods as get_lazy_methods
+from attr import get_linecache_footprint as get_linecache_footprint
+from attr import get_linecache_policy as get_linecache_policy
+from attr import get_precompiled_methods as get_precompiled_methods
+from attr import get_strip_validators as get_strip_validators
+from attr import get_template_cache_info as get_template_cache_info
 from attr import has as has
 from attr import make_class as make_class
 from attr import NOTHING as NOTHING
+from attr import profile_class_creation as profile_class_creation
+from attr import resolve_module_types as resolve_module_types
 from attr import resolve_types as resolve_types
+from attr import set_bytecode_cache as set_bytecode_cache
+from attr import set_lazy_methods as set_lazy_methods
+from attr import set_linecache_policy as set_linecache_policy
+from attr import set_precompiled_methods as set_precompiled_methods
+from attr import set_strip_validators as set_strip_validators
 from attr import setters as setters
 from attr import validate as validate
+from attr import validate_many as validate_many
 from attr import validators as validators
 from attr import attrib, asdict as asdict, astuple as astuple
 
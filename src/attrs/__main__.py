@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Command line tools for *attrs*.
+
+    python -m attrs profile-import [--limit N] MODULE
+
+imports *MODULE* while recording how long creating *attrs* classes takes and
+prints the slowest classes and phases.
+
+    python -m attrs generate MODULE
+
+imports *MODULE* and writes the companion module with the precompiled methods
+of its *attrs* classes next to it.
+"""
+
+import argparse
+import importlib
+import sys
+
+# attrs only creates its own classes once these modules are imported.  Import
+# them before profiling, so that they don't show up in the report.
+import attr._version_info
+import attr.validators  # noqa: F401
+
+from attr._precompile import _generate_companion
+from attr._profile import _format_report, profile_class_creation
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m attrs")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    profile_import = commands.add_parser(
+        "profile-import",
+        help="Import a module and print the slowest attrs classes and phases.",
+    )
+    profile_import.add_argument("module", help="Module to import.")
+    profile_import.add_argument(
+        "--limit",
+        type=int,
+        default=10,
+        help="Number of classes and phases to print (default: %(default)s).",
+    )
+
+    generate = commands.add_parser(
+        "generate",
+        help="Write the companion module with the precompiled methods of the "
+        "attrs classes in a module.",
+    )
+    generate.add_argument("module", help="Module to generate methods for.")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        print(f"Wrote {_generate_companion(args.module)}.")  # noqa: T201
+        return 0
+
+    with profile_class_creation() as records:
+        importlib.import_module(args.module)
+
+    print(_format_report(records, args.limit))  # noqa: T201
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
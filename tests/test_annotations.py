@@ -13,7 +13,7 @@ import pytest
 import attr
 
 from attr._compat import PY_3_14_PLUS
-from attr._make import _is_class_var
+from attr._make import _OBJ_SETATTR, _is_class_var
 from attr.exceptions import UnannotatedAttributeError
 
 
@@ -637,6 +637,33 @@ class TestAnnotations:
 
         assert_init_annotations(C, x=typing.List[int])
 
+    def test_init_type_hints_nested_forward_reference(self):
+        """
+        Forward references nested in non-string annotations in __init__ can be
+        automatically resolved.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib(type=typing.List["types.SimpleNamespace"])
+
+        assert_init_annotations(C, x=typing.List[types.SimpleNamespace])
+
+    def test_init_globals_only_referenced_names(self):
+        """
+        Only module globals that are referenced by annotations are copied into
+        the globals of __init__.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib(type="typing.List[int]")
+            y = attr.ib(type=int)
+
+        assert typing is C.__init__.__globals__["typing"]
+        assert "pytest" not in C.__init__.__globals__
+        assert "TestAnnotations" not in C.__init__.__globals__
+
     def test_init_type_hints_fake_module(self):
         """
         If you somehow set the __module__ to something that doesn't exist
@@ -671,6 +698,106 @@ class TestAnnotations:
         assert int is attr.fields(A).n.type
         assert int is attr.fields(B).n.type
 
+    def test_resolve_types_inherited_later(self):
+        """
+        Subclasses that are created after resolving the types of their base
+        class inherit the resolved types.
+        """
+
+        @attr.define
+        class A:
+            n: "int"
+
+        @attr.define
+        class B(A):
+            pass
+
+        attr.resolve_types(A)
+
+        @attr.define
+        class C(A):
+            pass
+
+        assert "int" == attr.fields(B).n.type
+        assert int is attr.fields(C).n.type
+
+    def test_resolve_types_sibling_subclasses(self):
+        """
+        Resolving the types of a subclass doesn't resolve the types of its
+        siblings, although they share the inherited attributes.
+        """
+
+        @attr.define
+        class B:
+            x: "int"
+
+        @attr.define
+        class S1(B):
+            pass
+
+        @attr.define
+        class S2(B):
+            pass
+
+        attr.resolve_types(S1)
+
+        assert int is attr.fields(S1).x.type
+        assert attr.fields(S1).x.inherited
+        assert "int" == attr.fields(S2).x.type
+        assert "int" == attr.fields(B).x.type
+
+    def test_resolve_types_inherited_validator(self):
+        """
+        Validators of inherited fields get the resolved type in __init__,
+        attrs.validate(), and on_setattr hooks.
+        """
+        types = []
+
+        def validator(_, attribute, __):
+            types.append(attribute.type)
+
+        @attr.define
+        class B:
+            x: "int" = attr.field(validator=validator)
+
+        @attr.define
+        class S(B):
+            pass
+
+        attr.resolve_types(S)
+
+        s = S(1)
+        attr.validate(s)
+        s.x = 2
+
+        assert [int, int, int] == types
+        assert int is attr.fields(S).x.type
+
+    def test_resolve_types_sibling_field_transformer(self):
+        """
+        Resolving the attribs that a field transformer gets doesn't resolve the
+        types of the siblings of the class.
+        """
+
+        def hook(cls, attribs):
+            attr.resolve_types(cls, attribs=attribs)
+            return attribs
+
+        @attr.define
+        class B:
+            x: "int"
+
+        @attr.define(field_transformer=hook)
+        class S1(B):
+            pass
+
+        @attr.define
+        class S2(B):
+            pass
+
+        assert int is attr.fields(S1).x.type
+        assert "int" == attr.fields(S2).x.type
+
     def test_resolve_twice(self):
         """
         You can call resolve_types as many times as you like.
@@ -690,6 +817,201 @@ class TestAnnotations:
         assert int is attr.fields(A).n.type
 
 
+MODULE = """\
+import typing
+
+import attr
+
+
+@attr.define
+class A:
+    a: "typing.List[A]"
+    b: "B"
+    c: typing.ClassVar[int] = 1
+
+
+@attr.define
+class B:
+    a: "A"
+    n: "typing.Optional[int]" = None
+
+
+@attr.define
+class C(A):
+    d: "typing.Optional[int]" = None
+
+
+@attr.define
+class D(C):
+    Nested = int
+
+    e: "Nested" = 0
+
+
+Alias = A
+"""
+
+
+def make_module(name, source):
+    """
+    Create a module called *name* from *source*.
+    """
+    module = types.ModuleType(name)
+    sys.modules[name] = module
+    try:
+        exec(source, module.__dict__)
+    finally:
+        del sys.modules[name]
+
+    return module
+
+
+@pytest.fixture(name="module")
+def _module():
+    """
+    A module with attrs classes that reference each other.
+    """
+    module = make_module("resolve_module", MODULE)
+    sys.modules[module.__name__] = module
+
+    yield module
+
+    del sys.modules[module.__name__]
+
+
+class TestResolveModuleTypes:
+    def test_resolves_all(self, module):
+        """
+        All attrs classes of the module are resolved, bases first.
+        """
+        assert [module.A, module.B, module.C, module.D] == (
+            attr.resolve_module_types(module)
+        )
+
+        assert typing.List[module.A] == attr.fields(module.A).a.type
+        assert module.B is attr.fields(module.A).b.type
+        assert module.A is attr.fields(module.B).a.type
+        assert typing.Optional[int] == attr.fields(module.B).n.type
+        assert module.B is attr.fields(module.C).b.type
+        assert typing.Optional[int] == attr.fields(module.C).d.type
+        assert int is attr.fields(module.D).e.type
+
+    def test_same_as_resolve_types(self, module):
+        """
+        The types are the same as the ones resolve_types() finds.
+        """
+        attr.resolve_module_types(module)
+        module_types = [
+            repr(a.type)
+            for cls in (module.A, module.B, module.C, module.D)
+            for a in attr.fields(cls)
+        ]
+
+        other = make_module("resolve_module", MODULE)
+        sys.modules[other.__name__] = other
+        for cls in (other.A, other.B, other.C, other.D):
+            attr.resolve_types(cls)
+
+        assert module_types == [
+            repr(a.type)
+            for cls in (other.A, other.B, other.C, other.D)
+            for a in attr.fields(cls)
+        ]
+
+    def test_evaluates_once(self, module, monkeypatch):
+        """
+        Each class is only passed to get_type_hints() with its own
+        annotations and identical strings are only evaluated once.
+        """
+        calls = []
+        get_type_hints = typing.get_type_hints
+
+        def recording_get_type_hints(obj, *args, **kw):
+            calls.append(dict(obj.__annotations__))
+            return get_type_hints(obj, *args, **kw)
+
+        monkeypatch.setattr(typing, "get_type_hints", recording_get_type_hints)
+
+        attr.resolve_module_types(module)
+
+        strings = [
+            annotation
+            for annotations in calls
+            for annotation in annotations.values()
+            if isinstance(annotation, str)
+        ]
+
+        assert 4 == len(calls)
+        assert len(strings) == len(set(strings))
+
+    def test_shadowed_names(self):
+        """
+        Strings that use names from the class body aren't shared with other
+        classes.
+        """
+        module = make_module(
+            "resolve_shadowed",
+            "import attr\n"
+            "@attr.define\n"
+            "class A:\n"
+            "    Nested = str\n"
+            "    a: 'Nested'\n"
+            "@attr.define\n"
+            "class B:\n"
+            "    Nested = int\n"
+            "    a: 'Nested'\n",
+        )
+
+        attr.resolve_module_types(module)
+
+        assert str is attr.fields(module.A).a.type
+        assert int is attr.fields(module.B).a.type
+
+    def test_localns(self):
+        """
+        globalns and localns are used like in resolve_types().
+        """
+        module = make_module(
+            "resolve_localns",
+            "import attr\n@attr.define\nclass A:\n    a: 'Missing'\n",
+        )
+
+        with pytest.raises(NameError):
+            attr.resolve_module_types(module)
+
+        attr.resolve_module_types(module, localns={"Missing": int})
+
+        assert int is attr.fields(module.A).a.type
+
+    def test_sibling_subclasses(self, module):
+        """
+        Subclasses from other modules that share inherited attributes with
+        the classes of the module aren't resolved.
+        """
+
+        @attr.define
+        class Other(module.C):
+            pass
+
+        attr.resolve_module_types(module)
+
+        assert typing.List[module.A] == attr.fields(module.C).a.type
+        assert "typing.List[A]" == attr.fields(Other).a.type
+        assert "B" == attr.fields(Other).b.type
+
+    def test_already_resolved(self, module):
+        """
+        Classes whose types have been resolved already are left alone.
+        """
+        attr.resolve_types(module.B)
+        _OBJ_SETATTR(attr.fields(module.B).a, "type", "sentinel")
+
+        attr.resolve_module_types(module)
+
+        assert "sentinel" == attr.fields(module.B).a.type
+        assert module.A is attr.fields(module.C).a.type.__args__[0]
+
+
 @pytest.mark.parametrize(
     "annot",
     [
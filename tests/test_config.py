@@ -4,6 +4,10 @@
 Tests for `attr._config`.
 """
 
+import os
+import subprocess
+import sys
+
 import pytest
 
 from attr import _config
@@ -41,3 +45,199 @@ class TestConfig:
         with pytest.raises(TypeError) as e:
             _config.set_run_validators("False")
         assert "'run' must be bool." == e.value.args[0]
+
+    def test_bytecode_cache_default(self):
+        """
+        The bytecode cache is disabled by default.
+        """
+        assert None is _config.get_bytecode_cache()
+
+    def test_set_bytecode_cache(self, tmp_path):
+        """
+        Sets `_bytecode_cache_dir` to an absolute path and creates the
+        directory.
+        """
+        cache_dir = tmp_path / "cache"
+
+        try:
+            _config.set_bytecode_cache(cache_dir)
+
+            assert str(cache_dir) == _config.get_bytecode_cache()
+            assert cache_dir.is_dir()
+        finally:
+            _config.set_bytecode_cache(None)
+
+        assert None is _config.get_bytecode_cache()
+
+    def test_bytecode_cache_wrong_type(self):
+        """
+        Passing anything else than a path or None raises TypeError.
+        """
+        with pytest.raises(TypeError) as e:
+            _config.set_bytecode_cache(42)
+
+        assert (
+            "'directory' must be a str, an os.PathLike, or None."
+            == e.value.args[0]
+        )
+
+    def test_lazy_methods_default(self):
+        """
+        Methods are generated eagerly by default.
+        """
+        assert False is _config.get_lazy_methods()
+
+    def test_set_lazy_methods(self):
+        """
+        Sets `_lazy_methods`.
+        """
+        _config.set_lazy_methods(True)
+        assert True is _config.get_lazy_methods()
+        _config.set_lazy_methods(False)
+        assert False is _config.get_lazy_methods()
+
+    def test_lazy_methods_wrong_type(self):
+        """
+        Passing anything else than a boolean raises TypeError.
+        """
+        with pytest.raises(TypeError) as e:
+            _config.set_lazy_methods("True")
+
+        assert "'lazy' must be bool." == e.value.args[0]
+
+    def test_linecache_policy_default(self):
+        """
+        Source code is registered eagerly and without bounds by default.
+        """
+        assert ("eager", None) == _config.get_linecache_policy()
+
+    def test_set_linecache_policy(self):
+        """
+        Sets `_linecache_policy` and `_linecache_max_entries`.
+        """
+        _config.set_linecache_policy("lazy", max_entries=10)
+        assert ("lazy", 10) == _config.get_linecache_policy()
+        _config.set_linecache_policy("eager")
+        assert ("eager", None) == _config.get_linecache_policy()
+
+    def test_linecache_policy_invalid(self):
+        """
+        Passing an unknown policy raises ValueError.
+        """
+        with pytest.raises(ValueError) as e:
+            _config.set_linecache_policy("lru")
+
+        assert (
+            "'policy' must be one of 'eager', 'lazy', or 'off'."
+            == e.value.args[0]
+        )
+
+    @pytest.mark.parametrize("max_entries", [0, -1, True, 1.5])
+    def test_linecache_max_entries_invalid(self, max_entries):
+        """
+        Passing anything else than a positive int or None as max_entries
+        raises ValueError.
+        """
+        with pytest.raises(ValueError) as e:
+            _config.set_linecache_policy("eager", max_entries=max_entries)
+
+        assert (
+            "'max_entries' must be a positive int or None." == e.value.args[0]
+        )
+
+    def test_precompiled_methods_default(self):
+        """
+        Companion modules are ignored by default.
+        """
+        assert False is _config.get_precompiled_methods()
+
+    def test_set_precompiled_methods(self):
+        """
+        Sets `_precompiled_methods`.
+        """
+        _config.set_precompiled_methods(True)
+        assert True is _config.get_precompiled_methods()
+        _config.set_precompiled_methods(False)
+        assert False is _config.get_precompiled_methods()
+
+    def test_precompiled_methods_wrong_type(self):
+        """
+        Passing anything else than a boolean raises TypeError.
+        """
+        with pytest.raises(TypeError) as e:
+            _config.set_precompiled_methods("True")
+
+        assert "'enabled' must be bool." == e.value.args[0]
+
+    def test_strip_validators_default(self):
+        """
+        Validators are kept by default.
+        """
+        assert False is _config.get_strip_validators()
+
+    def test_set_strip_validators(self):
+        """
+        Sets `_strip_validators`.
+        """
+        _config.set_strip_validators(True)
+        assert True is _config.get_strip_validators()
+        _config.set_strip_validators(False)
+        assert False is _config.get_strip_validators()
+
+    def test_strip_validators_wrong_type(self):
+        """
+        Passing anything else than a boolean raises TypeError.
+        """
+        with pytest.raises(TypeError) as e:
+            _config.set_strip_validators("True")
+
+        assert "'strip' must be bool." == e.value.args[0]
+
+    def test_strip_validators_environment(self):
+        """
+        Validators are stripped if ATTRS_STRIP_VALIDATORS is set.
+        """
+        code = "import attrs; print(attrs.get_strip_validators())"
+        env = {**os.environ, "ATTRS_STRIP_VALIDATORS": "1"}
+
+        assert (
+            "True\n"
+            == subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                check=True,
+                env=env,
+                text=True,
+            ).stdout
+        )
+
+    def test_strip_validators_environment_internal(self):
+        """
+        attrs' own classes keep checking their arguments even if
+        ATTRS_STRIP_VALIDATORS is set when `attr.validators` is imported.
+        """
+        code = """
+import attr.validators as v
+
+for make in (
+    lambda: v.deep_iterable(42),
+    lambda: v.deep_mapping(42, 42),
+    lambda: v.not_(v.instance_of(int), exc_types=42),
+):
+    try:
+        make()
+    except TypeError:
+        print("raised")
+"""
+        env = {**os.environ, "ATTRS_STRIP_VALIDATORS": "1"}
+
+        assert (
+            "raised\nraised\nraised\n"
+            == subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                check=True,
+                env=env,
+                text=True,
+            ).stdout
+        )
@@ -101,6 +101,7 @@ def _add_init(cls, frozen):
         base_attr_map={},
         is_exc=False,
         cls_on_setattr=None,
+        strip_validators=False,
         attrs_init=False,
     )
     return cls
@@ -1,5 +1,13 @@
 # SPDX-License-Identifier: MIT
 
+import subprocess
+import sys
+
+import pytest
+
+import attr
+import attrs
+
 
 class TestImportStar:
     def test_from_attr_import_star(self):
@@ -9,3 +17,69 @@ class TestImportStar:
         # attr_import_star contains `from attr import *`, which cannot
         # be done here because *-imports are only allowed on module level.
         from . import attr_import_star  # noqa: F401
+
+
+class TestLazyImports:
+    def test_not_imported_eagerly(self):
+        """
+        Importing attrs doesn't import submodules and standard library modules
+        that are only needed on first access.
+        """
+        code = "import sys, attrs; print(' '.join(sorted(sys.modules)))"
+        modules = set(
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout.split()
+        )
+
+        assert set() == modules & {
+            "attr._cmp",
+            "attr._typing",
+            "attr._version_info",
+            "attr.converters",
+            "attr.filters",
+            "attr.validators",
+            "attrs.validators",
+            "inspect",
+            "platform",
+            "typing",
+        }
+
+    @pytest.mark.parametrize(
+        ("mod", "name", "expected"),
+        [
+            (attr, "validators", "attr.validators"),
+            (attr, "converters", "attr.converters"),
+            (attr, "filters", "attr.filters"),
+            (attrs, "validators", "attrs.validators"),
+            (attrs, "converters", "attrs.converters"),
+            (attrs, "exceptions", "attrs.exceptions"),
+            (attrs, "filters", "attrs.filters"),
+            (attrs, "setters", "attrs.setters"),
+        ],
+    )
+    def test_submodules(self, mod, name, expected):
+        """
+        Lazy submodules are imported on first access.
+        """
+        assert getattr(mod, name) is sys.modules[expected]
+
+    def test_names(self):
+        """
+        Lazy names are the same in attr and attrs.
+        """
+        assert attr.cmp_using is attrs.cmp_using
+        assert attr.AttrsInstance is attrs.AttrsInstance
+        assert "attr.AttrsInstance" == (
+            f"{attr.AttrsInstance.__module__}.{attr.AttrsInstance.__name__}"
+        )
+
+    def test_unknown(self):
+        """
+        Unknown names still raise an AttributeError.
+        """
+        with pytest.raises(AttributeError, match="has no attribute nope"):
+            attrs.nope
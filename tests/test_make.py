@@ -7,8 +7,10 @@ Tests for `attr._make`.
 import copy
 import functools
 import gc
+import importlib.util
 import inspect
 import itertools
+import linecache
 import sys
 
 from operator import attrgetter
@@ -21,7 +23,7 @@ from hypothesis.strategies import booleans, integers, lists, sampled_from, text
 
 import attr
 
-from attr import _config
+from attr import _config, _make
 from attr._compat import PY_3_10_PLUS, PY_3_14_PLUS
 from attr._make import (
     Attribute,
@@ -33,12 +35,18 @@ from attr._make import (
     _determine_attrib_eq_order,
     _determine_attrs_eq_order,
     _determine_whether_to_implement,
+    _LazyLines,
+    _LazyMethod,
+    _made_classes,
+    _make_attr_tuple_class,
+    _strip_validate_hook,
     _transform_attrs,
     and_,
     fields,
     fields_dict,
     make_class,
     validate,
+    validate_many,
 )
 from attr.exceptions import DefaultAlreadySetError, NotAnAttrsClassError
 
@@ -204,6 +212,24 @@ class TestTransformAttrs:
             C, None, False, False, True, None
         )
 
+    def test_attr_tuple_class_shared(self):
+        """
+        Classes with the same name and attribute names share their tuple
+        class, others don't.
+        """
+
+        def make(name, *attr_names):
+            return make_class(name, list(attr_names))
+
+        C1 = make("C", "x", "y")
+        C2 = make("C", "x", "y")
+
+        assert type(fields(C1)) is type(fields(C2))
+        assert type(fields(C1)) is not type(fields(make("D", "x", "y")))
+        assert type(fields(C1)) is not type(fields(make("C", "y", "x")))
+        assert "CAttributes" == type(fields(C1)).__name__
+        assert fields(C1)[1] is fields(C1).y
+
     def test_transforms_to_attribute(self):
         """
         All `_CountingAttr`s are transformed into `Attribute`s.
@@ -467,6 +493,77 @@ class TestTransformAttrs:
         assert True is f(C).b.inherited
         assert False is f(C).c.inherited
 
+    def test_inherited_shared(self):
+        """
+        Subclasses share the copies of inherited attributes, also through
+        classes that aren't attrs classes.
+        """
+
+        @attr.s
+        class A:
+            a = attr.ib()
+
+        @attr.s
+        class B(A):
+            b = attr.ib()
+
+        class Plain(A):
+            pass
+
+        @attr.s
+        class C(Plain):
+            c = attr.ib()
+
+        assert attr.fields(B).a is attr.fields(C).a
+        assert attr.fields(B).a == attr.fields(A).a.evolve(inherited=True)
+
+    def test_inherited_unresolved_not_shared(self):
+        """
+        Attributes whose types resolve_types may change aren't shared, since
+        it changes them in place.
+        """
+
+        @attr.s(auto_attribs=True)
+        class A:
+            a: "int"
+            b: int
+
+        @attr.s
+        class B(A):
+            pass
+
+        @attr.s
+        class C(A):
+            pass
+
+        assert attr.fields(B).a is not attr.fields(C).a
+        assert attr.fields(B).b is attr.fields(C).b
+
+    def test_inherited_after_attrs_replaced(self):
+        """
+        If the attributes of a base class are replaced, subclasses inherit the
+        new ones.
+        """
+
+        @attr.s
+        class A:
+            a = attr.ib()
+
+        @attr.s
+        class B(A):
+            pass
+
+        A.__attrs_attrs__ = _make_attr_tuple_class("A", ["x"])(
+            [attr.fields(A).a.evolve(name="x")]
+        )
+
+        @attr.s
+        class C(A):
+            pass
+
+        assert ("a",) == tuple(a.name for a in attr.fields(B))
+        assert ("x",) == tuple(a.name for a in attr.fields(C))
+
 
 class TestAttributes:
     """
@@ -1212,6 +1309,104 @@ class TestMakeClass:
         assert attr.fields(C).a.type is bool
         assert {"a": "bool"} == C.__annotations__
 
+    def test_cache(self):
+        """
+        With cache=True, identical calls return the same class.
+        """
+        C1 = attr.make_class(
+            "C", {"a": attr.ib(default=1, type=int)}, cache=True, frozen=True
+        )
+        C2 = attr.make_class(
+            "C", {"a": attr.ib(default=1, type=int)}, cache=True, frozen=True
+        )
+
+        assert C1 is C2
+        assert C1 is attr.make_class(
+            "C", {"a": attr.ib(default=1, type=int)}, cache=True, frozen=True
+        )
+        assert __name__ == C1.__module__
+        assert {"a": int} == C1.__annotations__
+
+    @pytest.mark.parametrize(
+        ("attrs", "kw"),
+        [
+            ({"a": attr.ib(default=True, type=int)}, {"frozen": True}),
+            ({"a": attr.ib(default=1, type=str)}, {"frozen": True}),
+            ({"a": attr.ib(default=1, type=int)}, {"frozen": False}),
+            ({"b": attr.ib(default=1, type=int)}, {"frozen": True}),
+            (
+                {"a": attr.ib(default=1, type=int, metadata={"m": 1})},
+                {"frozen": True},
+            ),
+        ],
+    )
+    def test_cache_differs(self, attrs, kw):
+        """
+        Calls that differ in the attributes or arguments -- even in values
+        that compare equal -- get different classes.
+        """
+        C = attr.make_class(
+            "C", {"a": attr.ib(default=1, type=int)}, cache=True, frozen=True
+        )
+
+        assert C is not attr.make_class("C", attrs, cache=True, **kw)
+
+    def test_cache_off_by_default(self):
+        """
+        Without cache=True, a new class is created for each call.
+        """
+        assert attr.make_class("C", ["a"]) is not attr.make_class("C", ["a"])
+        assert attr.make_class("C", ["a"], cache=True) is not (
+            attr.make_class("C", ["a"])
+        )
+
+    @pytest.mark.parametrize(
+        ("v1", "v2"),
+        [
+            ((1,), (True,)),
+            (((1,), 2), ((True,), 2)),
+            (frozenset([1]), frozenset([True])),
+        ],
+    )
+    def test_cache_container_item_types(self, v1, v2):
+        """
+        Containers with equal items of different types are keyed apart, both
+        as defaults and in class bodies.
+        """
+        C1 = attr.make_class("C", {"a": attr.ib(default=v1)}, cache=True)
+        C2 = attr.make_class("C", {"a": attr.ib(default=v2)}, cache=True)
+        D1 = attr.make_class("D", ["a"], class_body={"b": v1}, cache=True)
+        D2 = attr.make_class("D", ["a"], class_body={"b": v2}, cache=True)
+
+        assert C1 is not C2
+        assert repr(v2) == repr(C2().a)
+        assert D1 is not D2
+        assert repr(v2) == repr(D2.b)
+
+    def test_cache_unhashable(self):
+        """
+        Calls with unhashable parts are not cached.
+        """
+        C1 = attr.make_class(
+            "C", {"a": attr.ib(metadata={"m": []})}, cache=True
+        )
+        C2 = attr.make_class(
+            "C", {"a": attr.ib(metadata={"m": []})}, cache=True
+        )
+
+        assert C1 is not C2
+        assert attr.fields(C1).a.metadata == attr.fields(C2).a.metadata
+
+    def test_cache_weak(self):
+        """
+        Cached classes are dropped once they're not referenced anymore.
+        """
+        attr.make_class("Weak", ["a"], cache=True)
+
+        gc.collect()
+
+        assert all(key[1] != "Weak" for key in _made_classes)
+
 
 class TestFields:
     """
@@ -1542,6 +1737,822 @@ class TestValidate:
 
         assert inspect.getsource(C1.__init__) == inspect.getsource(C2.__init__)
 
+    def test_generated_method(self, slots):
+        """
+        Classes with validators get an __attrs_validate__ method with the
+        validators inlined that validate calls and that raises the same
+        errors as calling the validators.
+        """
+
+        @attr.s(slots=slots)
+        class C:
+            x = attr.ib(
+                validator=[attr.validators.instance_of(int), raiser_if_42]
+            )
+            y = attr.ib(validator=attr.validators.in_([1, 2]))
+            z = attr.ib()
+
+        assert "isinstance" in C.__attrs_validate__.__code__.co_names
+
+        c = C(1, 2, 3)
+        validate(c)
+
+        for name, value in (("x", "1"), ("x", 42), ("y", 3)):
+            setattr(c, name, value)
+            a = getattr(fields(C), name)
+
+            with pytest.raises(Exception) as called:
+                a.validator(c, a, value)
+            with pytest.raises(called.type) as generated:
+                validate(c)
+
+            assert called.value.args == generated.value.args
+
+            setattr(c, name, 1)
+
+    def test_no_validators(self):
+        """
+        Classes without validators don't get the method unless they override
+        one.
+        """
+        C = make_class(
+            "C", {"x": attr.ib(validator=attr.validators.instance_of(int))}
+        )
+        D = make_class("D", {"y": attr.ib()})
+        E = make_class("E", {"x": attr.ib()}, bases=(C,))
+
+        assert "__attrs_validate__" not in D.__dict__
+        assert "__attrs_validate__" in E.__dict__
+
+        e = E(1)
+        e.x = "1"
+        validate(e)
+
+    def test_lazy(self):
+        """
+        The method is created lazily if lazy methods are enabled.
+        """
+        _config.set_lazy_methods(True)
+        try:
+            C = make_class(
+                "C", {"x": attr.ib(validator=attr.validators.instance_of(int))}
+            )
+        finally:
+            _config.set_lazy_methods(False)
+
+        assert isinstance(C.__dict__["__attrs_validate__"], _LazyMethod)
+
+        c = C(1)
+        c.x = "1"
+
+        with pytest.raises(TypeError):
+            validate(c)
+
+        assert not isinstance(C.__dict__["__attrs_validate__"], _LazyMethod)
+
+
+class TestValidateMany:
+    """
+    Tests for `validate_many`.
+    """
+
+    @pytest.fixture(name="C")
+    def _C(self):
+        return make_class(
+            "C",
+            {
+                "x": attr.ib(
+                    validator=[attr.validators.instance_of(int), raiser_if_42]
+                ),
+                "y": attr.ib(validator=attr.validators.in_(["a", "b"])),
+                "z": attr.ib(default=None),
+            },
+        )
+
+    def test_success(self, C):
+        """
+        Valid instances don't fail.
+        """
+        assert [] == validate_many(C, [C(1, "a"), C(2, "b")])
+
+    def test_failures(self, C):
+        """
+        All failures are collected attribute by attribute with the same errors
+        as validate.
+        """
+        with attr.validators.disabled():
+            instances = [C(1, "a"), C("2", "c"), C(42, "b"), C(3, "d")]
+
+        failures = validate_many(C, iter(instances))
+
+        x, y, _ = fields(C)
+
+        assert [(1, x), (2, x), (1, y), (3, y)] == [
+            (i, a) for i, a, _ in failures
+        ]
+
+        for i, a, e in failures:
+            with pytest.raises(type(e)) as ei:
+                a.validator(instances[i], a, getattr(instances[i], a.name))
+
+            assert ei.value.args == e.args
+
+    def test_compiled_once(self, C):
+        """
+        The functions for the columns are created once per class.
+        """
+        validate_many(C, [])
+        columns = _make._column_validators[C]
+        validate_many(C, [C(1, "a")])
+
+        assert columns is _make._column_validators[C]
+        assert ["x", "y"] == [a.name for a, _ in columns]
+
+    def test_disabled(self, C):
+        """
+        Nothing is validated if validators are disabled.
+        """
+        with attr.validators.disabled():
+            c = C("1", "c")
+
+            assert [] == validate_many(C, [c])
+
+        with attr.validators.disabled_in_context():
+            assert [] == validate_many(C, [c])
+
+        assert 2 == len(validate_many(C, [c]))
+
+    def test_not_an_attrs_class(self):
+        """
+        Passing a class that is not an attrs class raises.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            validate_many(object, [])
+
+
+def raiser_if_42(_, __, value):
+    if value == 42:
+        raise FloatingPointError
+
+
+class TestBytecodeCache:
+    """
+    Tests for the bytecode cache of generated methods.
+    """
+
+    @pytest.fixture(name="cache_dir")
+    def _cache_dir(self, tmp_path):
+        _config.set_bytecode_cache(tmp_path)
+
+        try:
+            yield tmp_path
+        finally:
+            _config.set_bytecode_cache(None)
+
+    def test_disabled_by_default(self, tmp_path, monkeypatch):
+        """
+        Nothing is written if no cache directory is set.
+        """
+        monkeypatch.chdir(tmp_path)
+
+        make_class("C", ["x"])
+
+        assert [] == list(tmp_path.iterdir())
+
+    def test_stores_and_loads(self, cache_dir, monkeypatch):
+        """
+        Compiled methods are stored in the cache directory and loaded from it
+        instead of being compiled again.
+        """
+        C1 = make_class("C", ["x", "y"], frozen=True)
+
+        assert list(cache_dir.glob("*.pyc"))
+
+        def compile(*args):
+            raise AssertionError("compile() called")
+
+        monkeypatch.setattr(_make, "compile", compile, raising=False)
+
+        C2 = make_class("C", ["x", "y"], frozen=True)
+
+        assert C2(1, 2) == C2(1, 2)
+        assert hash(C1(1, 2)) == hash(C2(1, 2))
+        assert "C(x=1, y=2)" == repr(C2(1, 2))
+
+    def test_relocates_filename(self, cache_dir):
+        """
+        Methods loaded from the cache point to the source of their own class.
+        """
+        make_class("C", ["x"])
+        C = make_class("D", ["x"])
+
+        filename = C.__init__.__code__.co_filename
+
+        assert filename.startswith("<attrs generated init tests.test_make.D")
+        assert "".join(linecache.getlines(filename)) == inspect.getsource(
+            C.__init__
+        )
+
+    @pytest.mark.parametrize(
+        "content", [b"", b"garbage", importlib.util.MAGIC_NUMBER + b"garbage"]
+    )
+    def test_ignores_invalid_entries(self, cache_dir, content):
+        """
+        Corrupt and foreign cache entries are ignored and overwritten.
+        """
+        make_class("C", ["x"])
+
+        for path in cache_dir.glob("*.pyc"):
+            path.write_bytes(content)
+
+        C = make_class("C", ["x"])
+
+        assert 1 == C(1).x
+        for path in cache_dir.glob("*.pyc"):
+            assert path.read_bytes().startswith(importlib.util.MAGIC_NUMBER)
+
+    def test_unwritable(self, cache_dir, monkeypatch):
+        """
+        If the cache can't be written, classes are still created.
+        """
+
+        def replace(*args):
+            raise PermissionError
+
+        monkeypatch.setattr(_make.os, "replace", replace)
+
+        C = make_class("C", ["x"])
+
+        assert 1 == C(1).x
+        assert [] == list(cache_dir.iterdir())
+
+
+class TestLazyMethods:
+    """
+    Tests for lazily generated methods.
+    """
+
+    @pytest.fixture(autouse=True)
+    def _lazy(self):
+        _config.set_lazy_methods(True)
+
+        try:
+            yield
+        finally:
+            _config.set_lazy_methods(False)
+
+    def test_placeholders(self, slots):
+        """
+        Until they're used, repr, equality, and ordering methods are
+        placeholders.
+        """
+
+        @attr.s(slots=slots, order=True)
+        class C:
+            x = attr.ib()
+
+        for name in ("__repr__", "__eq__", "__ne__", "__lt__", "__ge__"):
+            assert isinstance(C.__dict__[name], _LazyMethod)
+
+        assert "<lazy attrs method __repr__>" == repr(C.__dict__["__repr__"])
+
+    def test_generated_on_first_use(self, slots):
+        """
+        Once a method is used, the placeholders of its group are replaced by
+        the real methods.
+        """
+
+        @attr.s(slots=slots, order=True)
+        class C:
+            x = attr.ib()
+
+        assert C(1) == C(1)
+        assert isinstance(C.__dict__["__repr__"], _LazyMethod)
+        assert isinstance(C.__dict__["__lt__"], _LazyMethod)
+
+        eq = C.__dict__["__eq__"]
+        ne = C.__dict__["__ne__"]
+
+        assert inspect.isfunction(eq)
+        assert inspect.isfunction(ne)
+        assert "C.__eq__" == eq.__qualname__.rsplit(".<locals>.", 1)[-1]
+        assert eq.__doc__.startswith("Method generated by attrs")
+
+        assert "C(x=1)" == repr(C(1))
+        assert C(1) < C(2)
+        assert C(2) >= C(1)
+        assert inspect.isfunction(C.__dict__["__le__"])
+
+    def test_class_access(self):
+        """
+        Accessing the method on the class generates it, too.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib()
+
+        repr_ = C.__repr__
+
+        assert C.__dict__["__repr__"] is repr_
+        assert "C(x=1)" == C.__repr__(C(1))
+
+    def test_inherited(self, slots):
+        """
+        If a subclass uses an inherited placeholder first, the method is
+        attached to the class that holds the placeholder.
+        """
+
+        @attr.s(slots=slots)
+        class C:
+            x = attr.ib()
+
+        class D(C):
+            pass
+
+        assert "D(x=1)" == repr(D(1))
+        assert inspect.isfunction(C.__dict__["__repr__"])
+        assert "__repr__" not in D.__dict__
+
+    def test_str(self):
+        """
+        __str__ works with a lazy __repr__.
+        """
+
+        @attr.s(str=True)
+        class C:
+            x = attr.ib()
+
+        assert "C(x=1)" == str(C(1))
+
+    def test_no_references_to_original(self):
+        """
+        Placeholders of slotted classes don't hold on to the original class.
+        """
+
+        @attr.s(slots=True)
+        class C:
+            pass
+
+        @attr.s(slots=True)
+        class C2(C):
+            pass
+
+        gc.collect()
+
+        assert [C2] == C.__subclasses__()
+
+
+class TestStripValidators:
+    """
+    Tests for leaving validators out of classes.
+    """
+
+    @pytest.fixture(autouse=True)
+    def _strip(self):
+        _config.set_strip_validators(True)
+
+        try:
+            yield
+        finally:
+            _config.set_strip_validators(False)
+
+    def test_init(self, slots):
+        """
+        __init__ doesn't validate and doesn't reference validators or the
+        config.
+        """
+
+        @attr.s(slots=slots)
+        class C:
+            x = attr.ib(validator=attr.validators.instance_of(int))
+
+        assert "1" == C("1").x
+        assert not {"_config", "__attr_validator_x_1"} & set(
+            C.__init__.__code__.co_names
+        )
+
+    def test_on_setattr(self, slots):
+        """
+        setters.validate is left out of class-level and attribute-level
+        hooks and the default hooks of define still convert.
+        """
+
+        @attr.define(slots=slots)
+        class C:
+            x: int = attr.field(
+                validator=attr.validators.instance_of(int), converter=int
+            )
+            y: int = attr.field(validator=attr.validators.instance_of(int))
+            z: int = attr.field(
+                validator=attr.validators.instance_of(int),
+                on_setattr=attr.setters.validate,
+            )
+
+        @attr.s(slots=slots, on_setattr=attr.setters.validate)
+        class D:
+            x = attr.ib(validator=attr.validators.instance_of(int))
+
+        c = C("1", "2", "3")
+        c.x = "4"
+        c.y = "5"
+        c.z = "6"
+        d = D("1")
+        d.x = "2"
+
+        assert (4, "5", "6", "2") == (c.x, c.y, c.z, d.x)
+        assert "__setattr__" not in D.__dict__
+
+    def test_on_setattr_lists(self, slots):
+        """
+        setters.validate is left out of lists of class-level and
+        attribute-level hooks.
+        """
+
+        @attr.s(
+            slots=slots,
+            on_setattr=[attr.setters.convert, attr.setters.validate],
+        )
+        class C:
+            x = attr.ib(
+                validator=attr.validators.instance_of(int), converter=int
+            )
+            y = attr.ib(
+                validator=attr.validators.instance_of(int),
+                on_setattr=[attr.setters.validate],
+            )
+
+        c = C("1", "2")
+        c.x = "3"
+        c.y = "4"
+
+        assert (3, "4") == (c.x, c.y)
+
+    def test_on_setattr_pipes(self, slots):
+        """
+        setters.validate is left out of nested pipes and the other setters
+        still run.
+        """
+        calls = []
+
+        def record(_, __, value):
+            calls.append(value)
+            return value
+
+        @attr.s(slots=slots)
+        class C:
+            x = attr.ib(
+                validator=attr.validators.instance_of(int),
+                on_setattr=attr.setters.pipe(
+                    record,
+                    attr.setters.pipe(attr.setters.validate, record),
+                ),
+            )
+            y = attr.ib(
+                validator=attr.validators.instance_of(int),
+                on_setattr=attr.setters.pipe(
+                    attr.setters.validate, attr.setters.pipe()
+                ),
+            )
+
+        c = C(1, 2)
+        c.x = "3"
+        c.y = "4"
+
+        assert ("3", "4") == (c.x, c.y)
+        assert ["3", "3"] == calls
+
+    def test_on_setattr_only_validate(self, slots):
+        """
+        If only validate hooks are left out, no __setattr__ is written.
+        """
+
+        @attr.s(slots=slots, on_setattr=[attr.setters.validate])
+        class C:
+            x = attr.ib(validator=attr.validators.instance_of(int))
+            y = attr.ib(
+                validator=attr.validators.instance_of(int),
+                on_setattr=attr.setters.pipe(attr.setters.validate),
+            )
+
+        assert "__setattr__" not in C.__dict__
+
+    def test_on_setattr_unchanged(self):
+        """
+        Hooks without setters.validate are left alone.
+        """
+        hook = attr.setters.pipe(attr.setters.convert)
+
+        assert hook is _strip_validate_hook(hook)
+        assert attr.setters.frozen is _strip_validate_hook(attr.setters.frozen)
+
+    def test_validate(self):
+        """
+        Explicit validation still validates.
+        """
+        C = make_class(
+            "C", {"x": attr.ib(validator=attr.validators.instance_of(int))}
+        )
+
+        with pytest.raises(TypeError):
+            attr.validate(C("1"))
+
+    def test_existing_classes(self):
+        """
+        Classes that were created before validators are stripped keep
+        validating.
+        """
+        _config.set_strip_validators(False)
+        C = make_class(
+            "C",
+            {"x": attr.ib(validator=attr.validators.instance_of(int))},
+            cache=True,
+        )
+        _config.set_strip_validators(True)
+
+        with pytest.raises(TypeError):
+            C("1")
+
+        D = make_class(
+            "C",
+            {"x": attr.ib(validator=attr.validators.instance_of(int))},
+            cache=True,
+        )
+
+        assert D is not C
+        assert "1" == D("1").x
+
+    def test_frozen(self):
+        """
+        Frozen classes still refuse on_setattr hooks.
+        """
+        with pytest.raises(ValueError, match="Frozen classes can't use"):
+
+            @attr.s(frozen=True, on_setattr=attr.setters.validate)
+            class C:
+                x = attr.ib()
+
+
+class TestLinecache:
+    """
+    Tests for the linecache registration of generated methods.
+    """
+
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        try:
+            yield
+        finally:
+            _config.set_linecache_policy("eager")
+
+    def test_eager(self):
+        """
+        By default, the lines of the source are registered.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib()
+
+        filename = C.__init__.__code__.co_filename
+        entry = linecache.cache[filename]
+
+        assert isinstance(entry[2], list)
+        assert "def __init__(self, x):\n" == linecache.getline(filename, 1)
+
+    def test_lazy(self):
+        """
+        In lazy mode, the source is split into lines only once it's needed.
+        """
+        _config.set_linecache_policy("lazy")
+
+        @attr.s
+        class C:
+            x = attr.ib()
+
+        filename = C.__init__.__code__.co_filename
+        lines = linecache.cache[filename][2]
+
+        assert isinstance(lines, _LazyLines)
+        assert lines._lines is None
+        assert "def __init__(self, x):\n" == linecache.getline(filename, 1)
+        assert inspect.getsource(C.__init__).startswith("def __init__")
+
+        linecache.checkcache()
+
+        assert lines is linecache.cache[filename][2]
+
+    def test_lazy_same_source(self):
+        """
+        Lazy entries with the same source share a filename with eager ones.
+        """
+
+        def make():
+            @attr.s
+            class LinecacheLazySame:
+                x = attr.ib()
+
+            return LinecacheLazySame
+
+        C1 = make()
+        _config.set_linecache_policy("lazy")
+        C2 = make()
+        C3 = make()
+
+        assert (
+            C1.__init__.__code__.co_filename
+            == C2.__init__.__code__.co_filename
+            == C3.__init__.__code__.co_filename
+        )
+
+    def test_off(self):
+        """
+        If registration is off, no entries are added but the methods work.
+        """
+        _config.set_linecache_policy("off")
+
+        @attr.s
+        class LinecacheOff:
+            x = attr.ib()
+
+        filename = LinecacheOff.__init__.__code__.co_filename
+
+        assert filename.startswith("<attrs generated init ")
+        assert filename not in linecache.cache
+        assert LinecacheOff(1) == LinecacheOff(1)
+
+    def test_max_entries(self):
+        """
+        If max_entries is set, the least recently registered entries are
+        evicted.
+        """
+        linecache.clearcache()
+        _config.set_linecache_policy("eager", max_entries=2)
+
+        @attr.s(eq=False, repr=False)
+        class C:
+            x = attr.ib()
+
+        @attr.s(eq=False, repr=False)
+        class D:
+            x = attr.ib()
+
+        @attr.s(eq=False, repr=False)
+        class E:
+            x = attr.ib()
+
+        assert C.__init__.__code__.co_filename not in linecache.cache
+        assert D.__init__.__code__.co_filename in linecache.cache
+        assert E.__init__.__code__.co_filename in linecache.cache
+        assert 2 == attr.get_linecache_footprint()[0]
+
+    def test_max_entries_filenames_not_reused(self):
+        """
+        Filenames of evicted entries aren't handed out again, so the methods
+        of evicted classes don't show the source of newer classes.
+        """
+        _config.set_linecache_policy("eager", max_entries=1)
+
+        def make(names):
+            return attr.make_class(
+                "LinecacheReused", names, eq=False, repr=False
+            )
+
+        Old = make(["a"])
+        filename = Old.__init__.__code__.co_filename
+        attr.make_class("LinecacheEvicting", ["a"], eq=False, repr=False)
+        New = make(["a", "b", "c"])
+
+        assert filename not in linecache.cache
+        assert filename != New.__init__.__code__.co_filename
+
+        with pytest.raises(OSError):
+            inspect.getsource(Old.__init__)
+
+        assert inspect.getsource(New.__init__).startswith(
+            "def __init__(self, a, b, c)"
+        )
+
+    def test_unbounded_untracked(self):
+        """
+        Without max_entries, attrs doesn't keep track of the entries it
+        registers.
+        """
+
+        @attr.s(eq=False, repr=False)
+        class C:
+            x = attr.ib()
+
+        assert C.__init__.__code__.co_filename in linecache.cache
+        assert C.__init__.__code__.co_filename not in _make._linecache_entries
+
+    def test_footprint(self):
+        """
+        The footprint counts the entries that are still in linecache.
+        """
+        entries, size = attr.get_linecache_footprint()
+
+        @attr.s(eq=False, repr=False)
+        class C:
+            x = attr.ib()
+
+        filename = C.__init__.__code__.co_filename
+        new_entries, new_size = attr.get_linecache_footprint()
+
+        assert entries + 1 == new_entries
+        assert size + linecache.cache[filename][0] == new_size
+
+        linecache.clearcache()
+
+        assert (0, 0) == attr.get_linecache_footprint()
+
+
+class TestTemplateCache:
+    """
+    Tests for sharing the code of generated methods between classes.
+    """
+
+    def make(self):
+        @attr.s(hash=True)
+        class C:
+            x = attr.ib()
+            y = attr.ib(eq=attr.cmp_using(eq=lambda a, b: True))
+
+        return C
+
+    def test_shared(self):
+        """
+        A class with the same shape as an earlier one doesn't compile its
+        eq, hash, and repr again.
+        """
+        self.make()
+        info = attr.get_template_cache_info()
+
+        self.make()
+
+        assert info.hits + 3 == attr.get_template_cache_info().hits
+        assert info.misses == attr.get_template_cache_info().misses
+
+    def test_bound_to_own_globals(self):
+        """
+        Shared methods use the globals of their own class.
+        """
+        C1 = self.make()
+        C2 = self.make()
+
+        assert C1.__eq__.__code__.co_code == C2.__eq__.__code__.co_code
+        assert C1.__eq__.__globals__ is not C2.__eq__.__globals__
+        assert C1(1, 2) == C1(1, 3)
+        assert C1(1, 2) != C1(2, 2)
+        assert "C(x=1, y=2)" == repr(C2(1, 2))
+
+    def test_own_filename(self):
+        """
+        Shared methods point to the source of their own class.
+        """
+        C = self.make()
+
+        for meth in (C.__eq__, C.__hash__, C.__repr__):
+            filename = meth.__code__.co_filename
+
+            assert filename.startswith("<attrs generated ")
+            assert "".join(linecache.getlines(filename)) == (
+                inspect.getsource(meth)
+            )
+
+    def test_different_type_hash(self):
+        """
+        Instances of classes with the same shape and values hash differently.
+        """
+
+        @attr.s(frozen=True)
+        class C:
+            x = attr.ib()
+
+        @attr.s(frozen=True)
+        class D:
+            x = attr.ib()
+
+        assert C.__hash__.__code__.co_code == D.__hash__.__code__.co_code
+        assert hash(C(1)) != hash(D(1))
+
+    def test_cache_hash_defaults(self):
+        """
+        Keyword-only defaults are copied to the shared methods.
+        """
+
+        @attr.s(frozen=True, cache_hash=True)
+        class C:
+            x = attr.ib()
+
+        @attr.s(frozen=True, cache_hash=True)
+        class D:
+            x = attr.ib()
+
+        assert C.__hash__.__kwdefaults__ == D.__hash__.__kwdefaults__
+        assert C.__hash__.__kwdefaults__ is not D.__hash__.__kwdefaults__
+        assert hash(D(1)) == hash(D(1))
+
 
 # Hypothesis seems to cache values, so the lists of attributes come out
 # unsorted.
@@ -1685,6 +2696,7 @@ class TestClassBuilder:
             None,
             False,
             None,
+            False,
         )
 
         assert "<_ClassBuilder(cls=C)>" == repr(b)
@@ -1712,6 +2724,7 @@ class TestClassBuilder:
             None,
             False,
             None,
+            False,
         )
 
         cls = (
@@ -1791,6 +2804,7 @@ class TestClassBuilder:
             on_setattr=None,
             has_custom_setattr=False,
             field_transformer=None,
+            strip_validators=False,
         )
         b._cls = {}  # no __module__; no __qualname__
 
@@ -5,6 +5,7 @@ Integration tests for next-generation APIs.
 """
 
 import re
+import typing
 
 from contextlib import contextmanager
 from functools import partial
@@ -185,6 +186,26 @@ class TestNextGen:
 
         assert NewSchool2(1) == NewSchool2(1)
 
+    def test_auto_attribs_detect_single_pass(self):
+        """
+        define detects auto_attribs without collecting the attributes twice,
+        even if it has to fall back to auto_attribs=False.
+        """
+        with attrs.profile_class_creation() as records:
+
+            @attrs.define
+            class OldSchool:
+                x: int
+                y = attrs.field()
+
+            @attrs.define
+            class ClassVarField:
+                x: typing.ClassVar[int] = attrs.field()
+
+        assert 2 == sum(phase == "_transform_attrs" for _, phase, _ in records)
+        assert ["y"] == [a.name for a in attrs.fields(OldSchool)]
+        assert ["x"] == [a.name for a in attrs.fields(ClassVarField)]
+
     def test_exception(self):
         """
         Exceptions are detected and correctly handled.
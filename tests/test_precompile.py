@@ -0,0 +1,179 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Tests for `attr._precompile` and using precompiled methods.
+"""
+
+import importlib
+import sys
+
+import pytest
+
+from attr import _config, _make
+from attr._precompile import _companion_source, _generate_companion
+from attrs.__main__ import main
+
+
+MODULE = """\
+import attrs
+
+@attrs.define(hash=True)
+class Precompiled:
+    x: int = attrs.field(validator=attrs.validators.instance_of(int))
+    y: list = attrs.field(factory=list, hash=False)
+"""
+
+
+@pytest.fixture(name="module_dir")
+def _module_dir(tmp_path, monkeypatch):
+    """
+    Return a directory on sys.path that contains a package with a module with
+    an attrs class and clean up after the test.
+    """
+    pkg = tmp_path / "precompiled_pkg"
+    pkg.mkdir()
+    pkg.joinpath("__init__.py").write_text("")
+    pkg.joinpath("models.py").write_text(MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    # The module is rewritten faster than its mtime changes.
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+
+    yield tmp_path
+
+    _config.set_precompiled_methods(False)
+    _make._precompiled.clear()
+    _make._precompiled_modules.clear()
+    for name in list(sys.modules):
+        if name.startswith("precompiled_pkg"):
+            del sys.modules[name]
+
+
+def reimport():
+    """
+    Import precompiled_pkg.models again.
+    """
+    del sys.modules["precompiled_pkg.models"]
+    importlib.invalidate_caches()
+
+    return importlib.import_module("precompiled_pkg.models")
+
+
+class TestGenerate:
+    def test_writes_companion(self, module_dir):
+        """
+        The companion module is written next to the module and contains the
+        generated methods of its classes.
+        """
+        path = _generate_companion("precompiled_pkg.models")
+
+        expected = module_dir / "precompiled_pkg" / "models_attrs_generated.py"
+
+        assert str(expected) == path
+
+        source = expected.read_text()
+
+        for method in ("__init__", "__eq__", "__hash__", "__repr__"):
+            assert f"    def {method}(self" in source
+
+    def test_cli(self, module_dir, capsys):
+        """
+        `python -m attrs generate` writes the companion module.
+        """
+        assert 0 == main(["generate", "precompiled_pkg.models"])
+
+        path = module_dir / "precompiled_pkg" / "models_attrs_generated.py"
+
+        assert f"Wrote {path}.\n" == capsys.readouterr().out
+        assert path.exists()
+
+    def test_only_classes_of_module(self):
+        """
+        Scripts of classes from other modules are left out and identical
+        scripts are only written once.
+        """
+        source = _companion_source(
+            "m",
+            [
+                ("__eq__", "<attrs generated eq m.C>", "def __eq__(): pass"),
+                ("__eq__", "<attrs generated eq m.D>", "def __eq__(): pass"),
+                ("__eq__", "<attrs generated eq mm.E>", "def __eq__(): 1"),
+            ],
+        )
+
+        assert (
+            "# Generated by `python -m attrs generate m`.\n"
+            "# Don't edit, generate it again after changing the classes "
+            "instead.\n"
+            "\n"
+            "\n"
+            "def _0():\n"
+            "    def __eq__(): pass\n"
+            "\n"
+            "    return __eq__\n"
+            "\n"
+            "\n"
+            "precompiled = {\n"
+            f'    "{_make._fingerprint("def __eq__(): pass")}": _0,\n'
+            "}\n"
+        ) == source
+
+
+class TestPrecompiledMethods:
+    def test_disabled_by_default(self, module_dir):
+        """
+        Companion modules are ignored unless enabled.
+        """
+        _generate_companion("precompiled_pkg.models")
+
+        models = reimport()
+
+        assert "models_attrs_generated" not in (
+            models.Precompiled.__init__.__code__.co_filename
+        )
+
+    def test_uses_companion(self, module_dir, monkeypatch):
+        """
+        If enabled, methods are created from the companion module without
+        compiling them.
+        """
+        _generate_companion("precompiled_pkg.models")
+        _config.set_precompiled_methods(True)
+
+        def compile(*args):
+            raise AssertionError("compile() called")
+
+        monkeypatch.setattr(_make, "compile", compile, raising=False)
+        _make._method_template.cache_clear()
+
+        C = reimport().Precompiled
+
+        for method in (C.__init__, C.__eq__, C.__hash__, C.__repr__):
+            assert method.__code__.co_filename.endswith(
+                "models_attrs_generated.py"
+            )
+
+        assert C(1) == C(1)
+        assert hash(C(1)) == hash(C(1, [1]))
+        assert "Precompiled(x=1, y=[])" == repr(C(1))
+
+        with pytest.raises(TypeError):
+            C("1")
+
+    def test_stale_companion(self, module_dir):
+        """
+        Methods that changed since generating the companion module are
+        compiled as usual.
+        """
+        _generate_companion("precompiled_pkg.models")
+        module_dir.joinpath("precompiled_pkg", "models.py").write_text(
+            MODULE.replace("x: int", "renamed: int")
+        )
+        _config.set_precompiled_methods(True)
+
+        C = reimport().Precompiled
+
+        assert C.__init__.__code__.co_filename.startswith(
+            "<attrs generated init"
+        )
+        assert C(1) == C(1)
+        assert "Precompiled(renamed=1, y=[])" == repr(C(1))
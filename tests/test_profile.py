@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Tests for `attr._profile` and `python -m attrs profile-import`.
+"""
+
+import os
+import subprocess
+import sys
+
+import attr
+
+from attr import _profile
+from attr._make import _ClassBuilder
+from attrs.__main__ import main
+
+
+class TestProfileClassCreation:
+    def test_disabled_by_default(self):
+        """
+        Nothing is recorded outside of the context manager.
+        """
+        assert None is _profile._records
+
+    def test_records_phases(self):
+        """
+        The phases of creating a class are recorded and attributed to it.
+        """
+        with attr.profile_class_creation() as records:
+
+            @attr.define
+            class C:
+                x: int
+
+        name = f"{__name__}.{C.__qualname__}"
+        phases = {phase for cls, phase, _ in records if cls == name}
+
+        assert {
+            "total",
+            "_transform_attrs",
+            "_collect_base_attrs",
+            "add_init",
+            "add_repr",
+            "add_eq",
+            "_create_slots_class",
+            "compile",
+        } <= phases
+        assert all(seconds >= 0 for _, _, seconds in records)
+        assert None is _profile._records
+
+    def test_plain_builder(self):
+        """
+        The steps of the builder that is used outside of profiling aren't
+        wrapped.
+        """
+        assert not hasattr(_ClassBuilder.add_init, "__wrapped__")
+        assert not hasattr(_ClassBuilder._create_slots_class, "__wrapped__")
+
+    def test_nested(self):
+        """
+        Nested context managers record their own phases and pass them on to
+        the outer ones.
+        """
+        with attr.profile_class_creation() as outer:
+            with attr.profile_class_creation() as inner:
+
+                @attr.s
+                class C:
+                    x = attr.ib()
+
+            assert inner == outer
+
+        assert 1 == sum(phase == "total" for _, phase, _ in outer)
+
+    def test_format_report(self):
+        """
+        The report lists the slowest classes and phases first.
+        """
+        report = _profile._format_report(
+            [
+                ("m.A", "compile", 0.001),
+                ("m.A", "total", 0.002),
+                ("m.B", "compile", 0.003),
+                ("m.B", "total", 0.004),
+            ],
+            limit=1,
+        )
+
+        assert (
+            "Created 2 classes in 6.00ms.\n"
+            "\n"
+            "Slowest classes:\n"
+            "       4.000ms  m.B\n"
+            "\n"
+            "Slowest phases:\n"
+            "       4.000ms        2x  compile"
+        ) == report
+
+
+class TestProfileImport:
+    def test_profile_import(self, tmp_path, monkeypatch, capsys):
+        """
+        profile-import imports the module and prints the report.
+        """
+        tmp_path.joinpath("profiled_module.py").write_text(
+            "import attrs\n\n@attrs.define\nclass Profiled:\n    x: int\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        assert 0 == main(["profile-import", "profiled_module"])
+
+        out = capsys.readouterr().out
+
+        assert out.startswith("Created 1 classes in ")
+        assert "profiled_module.Profiled" in out
+        assert "add_init" in out
+
+        del sys.modules["profiled_module"]
+
+    def test_profile_import_skips_attrs(self, tmp_path):
+        """
+        Classes of attrs itself that are created on first access aren't
+        reported.
+        """
+        tmp_path.joinpath("profiled_validators.py").write_text(
+            "import attrs\n\n"
+            "@attrs.define\n"
+            "class Profiled:\n"
+            "    x: int = attrs.field(validator=attrs.validators.gt(0))\n"
+        )
+        env = {
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join([str(tmp_path), *sys.path]),
+        }
+
+        out = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "attrs",
+                "profile-import",
+                "--limit",
+                "100",
+                "profiled_validators",
+            ],
+            capture_output=True,
+            check=True,
+            env=env,
+            text=True,
+        ).stdout
+
+        assert out.startswith("Created 1 classes in ")
+        assert "profiled_validators.Profiled" in out
+        assert "attr.validators" not in out
@@ -4,13 +4,20 @@
 Tests for `attr.validators`.
 """
 
+import array
+import asyncio
+import operator
+import pickle
 import re
+import sys
+import threading
+import types
 
 import pytest
 
 import attr
 
-from attr import _config, fields, has
+from attr import _config, _make, fields, has
 from attr import validators as validator_module
 from attr.validators import (
     _subclass_of,
@@ -20,6 +27,7 @@ from attr.validators import (
     ge,
     gt,
     in_,
+    in_range,
     instance_of,
     is_callable,
     le,
@@ -98,6 +106,246 @@ class TestDisableValidators:
         assert _config._run_validators is True
 
 
+class TestSampling:
+    """
+    Tests for `set_sampling` and `get_sampling`.
+    """
+
+    @pytest.fixture(autouse=True)
+    def _reset_default(self):
+        """
+        Make sure all validators are run after a test.
+        """
+        yield
+        validator_module.set_sampling()
+
+    def test_default(self):
+        """
+        All validators are run by default.
+        """
+        assert None is _config._validation_check
+        assert (1.0, None) == validator_module.get_sampling()
+
+    def test_in_all(self):
+        """
+        The sampling functions are in ``__all__``.
+        """
+        assert {"set_sampling", "get_sampling"} <= set(
+            validator_module.__all__
+        )
+
+    def test_rate(self):
+        """
+        Only a rate fraction of instances is validated, starting with the
+        first one, both in __init__ and by setters.validate.
+        """
+        C = attr.make_class(
+            "C",
+            {"x": attr.ib(validator=instance_of(int))},
+            on_setattr=attr.setters.validate,
+        )
+
+        validator_module.set_sampling(0.34)
+
+        assert (0.34, None) == validator_module.get_sampling()
+
+        with pytest.raises(TypeError):
+            C("1")
+
+        c = C("1")
+        c.x = "2"
+
+        with pytest.raises(TypeError):
+            c.x = "3"
+
+        assert "2" == c.x
+
+        validator_module.set_sampling()
+
+        assert None is _config._validation_check
+
+        with pytest.raises(TypeError):
+            C("1")
+
+    @pytest.mark.parametrize(
+        ("rate", "pattern"),
+        [
+            (0.75, [True, False, True, True]),
+            (0.1, [True] + [False] * 9),
+        ],
+    )
+    def test_rate_honored(self, rate, pattern):
+        """
+        Rates that aren't of the form 1 / n are honored exactly, also over
+        many instances.
+        """
+        validator_module.set_sampling(rate)
+
+        try:
+            decisions = [_config._validation_check() for _ in range(3000)]
+        finally:
+            validator_module.set_sampling()
+
+        assert pattern * (3000 // len(pattern)) == decisions
+
+    def test_max_per_second(self, monkeypatch):
+        """
+        At most max_per_second instances per second are validated.
+        """
+        now = 0.0
+        monkeypatch.setattr(validator_module.time, "monotonic", lambda: now)
+        validator_module.set_sampling(max_per_second=2)
+        sampler = _config._validation_check
+
+        assert [True, True, False] == [sampler() for _ in range(3)]
+
+        now = 0.5
+
+        assert [True, False] == [sampler(), sampler()]
+
+        now = 10.0
+
+        assert [True, True, False] == [sampler() for _ in range(3)]
+        assert (1.0, 2) == validator_module.get_sampling()
+
+    def test_validate(self):
+        """
+        attrs.validate always validates.
+        """
+        C = attr.make_class("C", {"x": attr.ib(validator=instance_of(int))})
+        c = C(1)
+        c.x = "1"
+
+        validator_module.set_sampling(0.01)
+
+        for _ in range(3):
+            with pytest.raises(TypeError):
+                attr.validate(c)
+
+    @pytest.mark.parametrize(
+        "kw", [{"rate": 0}, {"rate": 1.5}, {"max_per_second": 0}]
+    )
+    def test_invalid(self, kw):
+        """
+        Rates must be between 0 and 1 and max_per_second positive.
+        """
+        with pytest.raises(ValueError):
+            validator_module.set_sampling(**kw)
+
+        assert None is _config._validation_check
+
+
+class TestDisabledInContext:
+    """
+    Tests for `disabled_in_context`.
+    """
+
+    @pytest.fixture(name="C")
+    def _C(self):
+        return attr.make_class(
+            "C",
+            {"x": attr.ib(validator=instance_of(int))},
+            on_setattr=attr.setters.validate,
+        )
+
+    def test_in_all(self):
+        """
+        The context manager is in ``__all__``.
+        """
+        assert "disabled_in_context" in validator_module.__all__
+
+    def test_disabled(self, C):
+        """
+        Validators don't run within the context and nothing is checked
+        outside of it.
+        """
+        assert None is _config._validation_check
+
+        with validator_module.disabled_in_context():
+            c = C("1")
+            c.x = "2"
+            attr.validate(c)
+
+            assert validator_module.get_disabled()
+
+        assert "2" == c.x
+        assert None is _config._validation_check
+        assert not validator_module.get_disabled()
+
+        with pytest.raises(TypeError):
+            C("1")
+
+    def test_other_threads(self, C):
+        """
+        Other threads keep validating.
+        """
+        errors = []
+
+        def create():
+            try:
+                C("1")
+            except TypeError as e:
+                errors.append(e)
+
+        with validator_module.disabled_in_context():
+            t = threading.Thread(target=create)
+            t.start()
+            t.join()
+
+        assert 1 == len(errors)
+
+    def test_other_tasks(self, C):
+        """
+        Other asyncio tasks keep validating.
+        """
+
+        async def trusted(entered, done):
+            with validator_module.disabled_in_context():
+                entered.set()
+                await done.wait()
+
+                return C("1")
+
+        async def untrusted(entered, done):
+            await entered.wait()
+            try:
+                with pytest.raises(TypeError):
+                    C("1")
+            finally:
+                done.set()
+
+        async def main():
+            # Before Python 3.10, events bind to the loop that is current when
+            # they're created, so create them in the running loop.
+            entered = asyncio.Event()
+            done = asyncio.Event()
+
+            return await asyncio.gather(
+                trusted(entered, done), untrusted(entered, done)
+            )
+
+        c, _ = asyncio.run(main())
+
+        assert "1" == c.x
+
+    def test_sampling(self, C):
+        """
+        Instances that are created in the context don't count as sampled.
+        """
+        validator_module.set_sampling(0.5)
+        try:
+            with validator_module.disabled_in_context():
+                C("1")
+                C("1")
+
+            with pytest.raises(TypeError):
+                C("1")
+        finally:
+            validator_module.set_sampling()
+
+        assert None is _config._validation_check
+
+
 class TestInstanceOf:
     """
     Tests for `instance_of`.
@@ -433,6 +681,69 @@ class TestIn_:
         v = in_([3, 4, 5])
         assert ("<in_ validator with options [3, 4, 5]>") == repr(v)
 
+    @pytest.mark.parametrize(
+        "options", [list(range(1000)), tuple(range(1000)), set(range(1000))]
+    )
+    def test_hashable_options(self, options):
+        """
+        Hashable options are looked up in a frozenset but the original options
+        are reported.
+        """
+        v = in_(options)
+        a = simple_attr("test")
+
+        v(None, a, 999)
+
+        assert frozenset(range(1000)) == v._lookup_options
+
+        with pytest.raises(ValueError) as e:
+            v(None, a, 1000)
+
+        assert options is e.value.args[2]
+
+    def test_unhashable_options(self):
+        """
+        Unhashable options are searched linearly.
+        """
+        C = attr.make_class(
+            "C", {"x": attr.ib(validator=in_([[1], 2]))}, slots=True
+        )
+
+        C([1])
+        C(2)
+
+        with pytest.raises(ValueError, match=r"must be in \[\[1\], 2\]"):
+            C([2])
+
+    def test_unhashable_value(self):
+        """
+        Unhashable values that are equal to a hashable option pass.
+        """
+
+        class EqualsOne:
+            __hash__ = None
+
+            def __eq__(self, other):
+                return other == 1
+
+        C = attr.make_class("C", {"x": attr.ib(validator=in_([1, 2]))})
+
+        C(EqualsOne())
+        in_([1, 2])(None, simple_attr("test"), EqualsOne())
+
+        with pytest.raises(ValueError):
+            C([1])
+
+    def test_substring(self):
+        """
+        String options still check for substrings.
+        """
+        v = in_("abc")
+
+        v(None, simple_attr("test"), "bc")
+
+        assert "abc" == v._lookup_options
+
     def test_is_hashable(self):
         """
         `in_` is hashable, so fields using it can be used with the include and
@@ -449,6 +760,113 @@ class TestIn_:
         attr.asdict(i, filter=attr.filters.exclude(lambda val: True))
 
 
+class TestInlined:
+    """
+    Tests for validators that are inlined into the generated ``__init__``.
+    """
+
+    @pytest.mark.parametrize(
+        ("validator", "good", "bad"),
+        [
+            (instance_of(int), 1, "1"),
+            (optional(instance_of(int)), None, "1"),
+            (in_([1, 2]), 2, 3),
+            (in_("abc"), "b", None),
+            (optional([instance_of(str), in_(["a"])]), "a", "b"),
+            (optional([instance_of(str), in_(["a"])]), "a", 1),
+            ([instance_of(int), in_([1])], 1, 2),
+            ([instance_of(int), ge(0), lt(10)], 0, "0"),
+            ([instance_of(int), ge(0), lt(10)], 9, -1),
+            ([instance_of(int), ge(0), lt(10)], 9, 10),
+            ([ge(0), in_([1, 2]), lt(2)], 1, 2),
+            (in_range(0, 10), 0, 10),
+            ([instance_of(float), in_range(0.0, 1.0)], 0.5, 1),
+        ],
+    )
+    def test_same_as_call(self, validator, good, bad):
+        """
+        Inlined validators accept and reject the same values and raise the
+        same errors as calling them.
+        """
+        C = attr.make_class("C", {"x": attr.ib(validator=validator)})
+        a = fields(C).x
+
+        C(good)
+
+        with pytest.raises(Exception) as called:
+            a.validator(None, a, bad)
+        with pytest.raises(called.type) as inlined:
+            C(bad)
+
+        assert called.value.args == inlined.value.args
+
+    def test_inlined(self):
+        """
+        The checks of instance_of, optional, and in_ are inlined.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib(validator=instance_of(int))
+            y = attr.ib(validator=optional(in_({1, 2})))
+
+        assert "isinstance" in C.__init__.__code__.co_names
+
+    def test_conditions_joined(self):
+        """
+        The conditions of consecutive validators are checked in a single if
+        statement in the order of the validators.
+        """
+        globs = {}
+        compiler = _make._ValidatorCompiler(globs, "v", "inst", "attr")
+
+        lines = compiler.check(
+            and_(instance_of(int), in_range(0, 10), in_([1])), "value"
+        )
+
+        assert [
+            "if not ((isinstance(value, v_1)) and (value >= v_2 and "
+            "value < v_3)):",
+            "    v_4(inst, attr, value)",
+            "    v_5(inst, attr, value)",
+        ] == lines[:3]
+        assert (int, 0, 10) == (globs["v_1"], globs["v_2"], globs["v_3"])
+
+    def test_custom_compare_func(self):
+        """
+        Number validators with unknown compare functions are called.
+        """
+        v = validator_module._NumberValidator(
+            5, "<", lambda value, bound: True
+        )
+        C = attr.make_class("C", {"x": attr.ib(validator=[v, ge(0)])})
+
+        C(10)
+
+        with pytest.raises(ValueError, match="'x' must be >= 0: -1"):
+            C(-1)
+
+    def test_disabled(self):
+        """
+        Inlined checks don't run if validators are disabled.
+        """
+        C = attr.make_class("C", {"x": attr.ib(validator=instance_of(int))})
+
+        with validator_module.disabled():
+            assert "1" == C("1").x
+
+    def test_empty_and(self):
+        """
+        Empty compositions of validators don't break the generated code.
+        """
+        C = attr.make_class(
+            "C",
+            {"x": attr.ib(validator=optional([])), "y": attr.ib(validator=[])},
+        )
+
+        assert 1 == C(1, 2).x
+
+
 @pytest.fixture(
     name="member_validator",
     params=(
@@ -621,6 +1039,105 @@ class TestDeepIterable:
 
         assert expected_repr == repr(v)
 
+    @pytest.mark.parametrize(
+        ("member_validator", "good", "bad"),
+        [
+            (
+                instance_of(int),
+                array.array("q", [1, 2]),
+                array.array("d", [1]),
+            ),
+            (
+                instance_of((str, bytes)),
+                array.array("u", "ab"),
+                array.array("b", [1]),
+            ),
+            (
+                [instance_of(int), ge(0)],
+                array.array("i", [0, 1]),
+                array.array("i", [0, -1]),
+            ),
+        ],
+    )
+    def test_array(self, member_validator, good, bad):
+        """
+        Members of `array.array` are validated like members of other
+        iterables.
+        """
+        C = attr.make_class(
+            "C", {"x": attr.ib(validator=deep_iterable(member_validator))}
+        )
+
+        C(good)
+
+        with pytest.raises(Exception) as array_e:
+            C(bad)
+        with pytest.raises(array_e.type) as list_e:
+            C(list(bad))
+
+        assert list_e.value.args == array_e.value.args
+
+    def test_numpy(self, monkeypatch):
+        """
+        Members of one-dimensional NumPy arrays are checked by their dtype and
+        their bounds using min() and max() without iterating over them.  If
+        they fail, they're validated one by one.
+        """
+
+        class ndarray(list):
+            ndim = 1
+            dtype = types.SimpleNamespace(kind="f", type=float)
+            size = property(len)
+
+            def __iter__(self):
+                self.iterated = True
+                return super().__iter__()
+
+            def min(self):
+                return min(list.__iter__(self))
+
+            def max(self):
+                return max(list.__iter__(self))
+
+        monkeypatch.setitem(
+            sys.modules, "numpy", types.SimpleNamespace(ndarray=ndarray)
+        )
+        v = deep_iterable([instance_of(float), ge(0), lt(10)])
+        a = simple_attr("test")
+        good = ndarray([0.0, 9.5])
+
+        v(None, a, good)
+
+        assert not hasattr(good, "iterated")
+
+        bad = ndarray([0.0, 10.0])
+
+        with pytest.raises(ValueError, match=r"'test' must be < 10: 10.0"):
+            v(None, a, bad)
+
+        assert bad.iterated
+
+    def test_unsummarized_types(self):
+        """
+        Containers with known member types aren't checked by the types of
+        their members for types whose instance checks might differ.
+        """
+
+        class Meta(type):
+            def __instancecheck__(cls, instance):
+                return False
+
+            def __subclasscheck__(cls, subclass):
+                return True
+
+        class Never(metaclass=Meta):
+            pass
+
+        with pytest.raises(TypeError):
+            deep_iterable(instance_of(Never))(
+                None, simple_attr("test"), array.array("q", [1])
+            )
+
 
 class TestDeepMapping:
     """
@@ -865,6 +1382,74 @@ class TestLtLeGeGt:
         assert repr(nv) == f"<Validator for x {nv.compare_op} {23}>"
 
 
+class TestInRange:
+    """
+    Tests for `in_range`.
+    """
+
+    def test_in_all(self):
+        """
+        validator is in ``__all__``.
+        """
+        assert in_range.__name__ in validator_module.__all__
+
+    @pytest.mark.parametrize(
+        ("kw", "good", "bad"),
+        [
+            ({}, [0, 5, 9.5], [-1, 10]),
+            ({"lo_inclusive": False}, [0.5, 9], [0, 10]),
+            ({"hi_inclusive": True}, [0, 10], [-0.5, 10.5]),
+            (
+                {"lo_inclusive": False, "hi_inclusive": True},
+                [0.5, 10],
+                [0, 11],
+            ),
+        ],
+    )
+    def test_check(self, kw, good, bad):
+        """
+        Values inside of the range pass, values outside of it raise the same
+        errors as the composed bounds validators.
+        """
+        v = in_range(0, 10, **kw)
+        bounds = and_(
+            ge(0) if kw.get("lo_inclusive", True) else gt(0),
+            le(10) if kw.get("hi_inclusive", False) else lt(10),
+        )
+        a = simple_attr("test")
+
+        for value in good:
+            v(None, a, value)
+
+        for value in bad:
+            with pytest.raises(ValueError) as e:
+                v(None, a, value)
+            with pytest.raises(ValueError) as composed:
+                bounds(None, a, value)
+
+            assert composed.value.args == e.value.args
+
+    def test_repr(self):
+        """
+        __repr__ is meaningful.
+        """
+        assert "<in_range validator for 0 <= x < 10>" == repr(in_range(0, 10))
+        assert "<in_range validator for 0 < x <= 10>" == repr(
+            in_range(0, 10, lo_inclusive=False, hi_inclusive=True)
+        )
+
+    def test_deep_iterable(self):
+        """
+        Bounds of in_range are used for checking arrays at once.
+        """
+        assert (
+            ((int,),),
+            ((operator.ge, 0), (operator.lt, 10)),
+        ) == validator_module._summarize_members(
+            and_(instance_of(int), in_range(0, 10))
+        )
+
+
 class TestMaxLen:
     """
     Tests for `max_len`.
@@ -1312,3 +1897,94 @@ class TestOr:
             "<or validator wrapping (<instance_of validator for type "
             "<class 'int'>>, <instance_of validator for type <class 'str'>>)>"
         ) == repr(v)
+
+
+class TestCompiled:
+    """
+    Tests for composed validators that compile themselves on first call.
+    """
+
+    @pytest.mark.parametrize(
+        ("validator", "good", "bad"),
+        [
+            (and_(instance_of(int), ge(0)), 1, -1),
+            (or_(instance_of(str), in_([1])), 1, 2),
+            (optional(deep_iterable(instance_of(int))), None, [1, "2"]),
+            (
+                deep_iterable(
+                    or_(instance_of(int), deep_iterable(instance_of(str))),
+                    instance_of(list),
+                ),
+                [1, ["a"]],
+                [1, ["a", 2]],
+            ),
+            (
+                optional(deep_mapping(instance_of(str), instance_of(int))),
+                {"a": 1},
+                {"a": "1"},
+            ),
+            (
+                deep_mapping(instance_of(str), always_pass, instance_of(dict)),
+                {"a": 1},
+                {1: "a"},
+            ),
+        ],
+    )
+    def test_same_as_init(self, validator, good, bad):
+        """
+        Compiled validators accept and reject the same values and raise the
+        same errors as the inlined checks in __init__.
+        """
+        C = attr.make_class("C", {"x": attr.ib(validator=validator)})
+        a = fields(C).x
+
+        validator(None, a, good)
+        C(good)
+
+        with pytest.raises(Exception) as called:
+            validator(None, a, bad)
+        with pytest.raises(called.type) as inlined:
+            C(bad)
+
+        assert called.value.args == inlined.value.args
+
+    def test_compiled_once(self):
+        """
+        The validator is compiled on its first call and validators of the
+        same shape share their code.
+        """
+        v1 = deep_iterable(instance_of(int))
+        v2 = deep_iterable(instance_of(str))
+
+        v1(None, simple_attr("test"), [1])
+        compiled = v1._compiled
+        v1(None, simple_attr("test"), [2])
+        hits = attr.get_template_cache_info().hits
+        v2(None, simple_attr("test"), ["a"])
+
+        assert compiled is v1._compiled
+        assert hits + 1 == attr.get_template_cache_info().hits
+        assert v1._compiled is not v2._compiled
+        assert v1._compiled.__code__ is v2._compiled.__code__
+
+    def test_no_linecache(self):
+        """
+        Compiled validators don't register their source in linecache.
+        """
+        before = attr.get_linecache_footprint()
+
+        for _ in range(3):
+            and_(instance_of(int), ge(0))(None, simple_attr("test"), 1)
+
+        assert before == attr.get_linecache_footprint()
+
+    def test_unaffected(self):
+        """
+        The compiled function is neither compared nor pickled.
+        """
+        v = and_(instance_of(int), ge(0))
+        v(None, simple_attr("test"), 1)
+
+        assert and_(instance_of(int), ge(0)) == v
+        assert hash(and_(instance_of(int), ge(0))) == hash(v)
+        assert v == pickle.loads(pickle.dumps(v))
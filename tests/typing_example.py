@@ -257,6 +257,14 @@ class Validated3:
     num: int = attr.field(validator=attr.validators.ge(0))
 
 
+@attrs.define
+class ValidatedRange:
+    num: int = attrs.field(validator=attrs.validators.in_range(0, 10))
+    ratio: float = attrs.field(
+        validator=attrs.validators.in_range(0.0, 1.0, hi_inclusive=True)
+    )
+
+
 with attr.validators.disabled():
     Validated2(num=-1)
 